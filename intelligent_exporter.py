@@ -5,7 +5,9 @@ This module provides enhanced data export capabilities with multiple formats
 optimized for different use cases and RAG systems.
 """
 
+import io
 import json
+import string
 import jsonlines
 import pandas as pd
 from datetime import datetime
@@ -13,6 +15,13 @@ from pathlib import Path
 from typing import Dict, List, Optional, Union
 from dataclasses import asdict
 import csv
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from rich.console import Console
 from rich.table import Table
 from rich.text import Text
@@ -22,6 +31,13 @@ from intelligent_scraper import IntelligentHotelInfo
 
 console = Console()
 
+# Characters allowed in exported filenames; everything else is stripped in one
+# C-level str.translate pass instead of a per-character generator.
+_ALLOWED_FILENAME_CHARS = frozenset(string.ascii_letters + string.digits + ' -_')
+_FILENAME_TRANS = str.maketrans(
+    '', '', ''.join(chr(i) for i in range(128) if chr(i) not in _ALLOWED_FILENAME_CHARS)
+)
+
 class IntelligentDataExporter:
     """Enhanced data exporter with AI insights formatting"""
     
@@ -34,12 +50,24 @@ class IntelligentDataExporter:
         """Export hotel data in specified format(s)"""
         if isinstance(formats, str):
             formats = [formats] if formats != "all" else [
-                "json", "jsonl", "csv", "rag_text", "markdown", "summary"
+                "json", "jsonl", "csv", "parquet", "feather",
+                "rag_text", "markdown", "summary"
             ]
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        hotel_name_clean = "".join(c for c in hotel_info.hotel_name if c.isalnum() or c in (' ', '-', '_')).strip()
-        
+        hotel_name_clean = hotel_info.hotel_name.translate(_FILENAME_TRANS)
+        if not hotel_name_clean.isascii():
+            # The deletion table only spans ASCII; names with '™', '–' or
+            # emoji take the per-character path, which keeps non-ASCII
+            # letters and digits the way the isalnum() filter always did
+            hotel_name_clean = ''.join(
+                c for c in hotel_name_clean if c.isascii() or c.isalnum())
+        hotel_name_clean = hotel_name_clean.strip()
+
+        # Format shared header values once per export instead of once per format
+        scraped_at_str = str(hotel_info.scraped_at)
+        confidence_str = f"{hotel_info.confidence_score:.2f}"
+
         exported_files = {}
         
         for format_type in formats:
@@ -59,19 +87,34 @@ class IntelligentDataExporter:
                     filepath = self._export_csv(hotel_info, filename)
                     exported_files["csv"] = str(filepath)
                 
+                elif format_type == "parquet":
+                    filename = f"{hotel_name_clean}_{timestamp}.parquet"
+                    filepath = self._export_parquet(hotel_info, filename)
+                    exported_files["parquet"] = str(filepath)
+
+                elif format_type == "feather":
+                    filename = f"{hotel_name_clean}_{timestamp}.feather"
+                    filepath = self._export_feather(hotel_info, filename)
+                    exported_files["feather"] = str(filepath)
+
                 elif format_type == "rag_text":
                     filename = f"{hotel_name_clean}_{timestamp}_rag.txt"
-                    filepath = self._export_rag_text(hotel_info, filename)
+                    filepath = self._export_rag_text(hotel_info, filename,
+                                                     scraped_at_str=scraped_at_str,
+                                                     confidence_str=confidence_str)
                     exported_files["rag_text"] = str(filepath)
                 
                 elif format_type == "markdown":
                     filename = f"{hotel_name_clean}_{timestamp}.md"
-                    filepath = self._export_markdown(hotel_info, filename)
+                    filepath = self._export_markdown(hotel_info, filename,
+                                                     scraped_at_str=scraped_at_str,
+                                                     confidence_str=confidence_str)
                     exported_files["markdown"] = str(filepath)
                 
                 elif format_type == "summary":
                     filename = f"{hotel_name_clean}_{timestamp}_summary.txt"
-                    filepath = self._export_summary(hotel_info, filename)
+                    filepath = self._export_summary(hotel_info, filename,
+                                                    scraped_at_str=scraped_at_str)
                     exported_files["summary"] = str(filepath)
                     
             except Exception as e:
@@ -82,8 +125,15 @@ class IntelligentDataExporter:
     def _export_json(self, hotel_info: IntelligentHotelInfo, filename: str) -> Path:
         """Export as structured JSON"""
         filepath = self.output_dir / filename
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(asdict(hotel_info), f, indent=2, default=str, ensure_ascii=False)
+        data = asdict(hotel_info)
+        if ORJSON_AVAILABLE:
+            filepath.write_bytes(orjson.dumps(
+                data, default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            ))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, default=str, ensure_ascii=False)
         return filepath
     
     def _export_jsonl(self, hotel_info: IntelligentHotelInfo, filename: str) -> Path:
@@ -105,6 +155,50 @@ class IntelligentDataExporter:
         df.to_csv(filepath, index=False, encoding='utf-8')
         return filepath
     
+    def _export_parquet(self, hotel_info: IntelligentHotelInfo, filename: str) -> Path:
+        """Export as Parquet through the Arrow C++ writer"""
+        filepath = self.output_dir / filename
+        df = pd.DataFrame([self._flatten_dict(asdict(hotel_info))])
+        df.to_parquet(filepath, compression='snappy')
+        return filepath
+
+    def _export_feather(self, hotel_info: IntelligentHotelInfo, filename: str) -> Path:
+        """Export as Feather (Arrow IPC), the fastest format to reload"""
+        filepath = self.output_dir / filename
+        df = pd.DataFrame([self._flatten_dict(asdict(hotel_info))])
+        df.to_feather(filepath)
+        return filepath
+
+    def export_many_csv(self, hotels: List[IntelligentHotelInfo],
+                        filename: Optional[str] = None) -> Path:
+        """Export multiple hotels into a single CSV using a columnar layout
+
+        Flattens every hotel first, then builds a dict of columns (SoA) rather
+        than a list of row dicts, so pandas writes the frame column-by-column
+        without re-aligning each row.
+        """
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"hotels_batch_{timestamp}.csv"
+        filepath = self.output_dir / filename
+
+        flattened = [self._flatten_dict(asdict(hotel)) for hotel in hotels]
+
+        # Union of columns in first-seen order
+        columns = {}
+        for row in flattened:
+            for key in row:
+                columns.setdefault(key, None)
+
+        # Columns outside, rows inside: one list per column instead of one
+        # dict per row (pyarrow would be the next step, but pandas already
+        # consumes dict-of-lists natively)
+        column_data = {col: [row.get(col) for row in flattened] for col in columns}
+
+        df = pd.DataFrame(column_data)
+        df.to_csv(filepath, index=False, encoding='utf-8')
+        return filepath
+
     def _flatten_dict(self, d: Dict, parent_key: str = '', sep: str = '_') -> Dict:
         """Flatten nested dictionary for CSV export"""
         items = []
@@ -129,211 +223,224 @@ class IntelligentDataExporter:
         
         return dict(items)
     
-    def _export_rag_text(self, hotel_info: IntelligentHotelInfo, filename: str) -> Path:
+    def _export_rag_text(self, hotel_info: IntelligentHotelInfo, filename: str,
+                         scraped_at_str: Optional[str] = None,
+                         confidence_str: Optional[str] = None) -> Path:
         """Export in optimized format for RAG systems"""
         filepath = self.output_dir / filename
+        if scraped_at_str is None:
+            scraped_at_str = str(hotel_info.scraped_at)
+        if confidence_str is None:
+            confidence_str = f"{hotel_info.confidence_score:.2f}"
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            # Header with metadata
-            f.write(f"HOTEL INFORMATION PROFILE\n")
-            f.write(f"{'=' * 50}\n\n")
-            f.write(f"Hotel Name: {hotel_info.hotel_name}\n")
-            f.write(f"Website: {hotel_info.website_url}\n")
-            f.write(f"Data Quality Score: {hotel_info.confidence_score:.2f}/1.0\n")
-            f.write(f"Last Updated: {hotel_info.scraped_at}\n")
-            
-            if hotel_info.sentiment_score is not None:
-                sentiment_text = "Positive" if hotel_info.sentiment_score > 0.6 else "Neutral" if hotel_info.sentiment_score > 0.4 else "Negative"
-                f.write(f"Content Sentiment: {sentiment_text} ({hotel_info.sentiment_score:.2f})\n")
-            
-            f.write(f"\n{'=' * 50}\n\n")
-            
-            # Contact Information
-            f.write("CONTACT AND LOCATION\n")
-            f.write("-" * 20 + "\n")
-            if hotel_info.phone:
-                f.write(f"Phone: {hotel_info.phone}\n")
-            if hotel_info.email:
-                f.write(f"Email: {hotel_info.email}\n")
-            if hotel_info.address:
-                f.write(f"Address: {hotel_info.address}\n")
-            if hotel_info.city and hotel_info.state:
-                f.write(f"Location: {hotel_info.city}, {hotel_info.state}\n")
-            f.write("\n")
-            
-            # Policies
-            f.write("HOTEL POLICIES\n")
-            f.write("-" * 14 + "\n")
-            if hotel_info.checkin_time:
-                f.write(f"Check-in Time: {hotel_info.checkin_time}\n")
-            if hotel_info.checkout_time:
-                f.write(f"Check-out Time: {hotel_info.checkout_time}\n")
-            if hotel_info.cancellation_policy:
-                f.write(f"Cancellation Policy: {hotel_info.cancellation_policy}\n")
-            if hotel_info.pet_policy:
-                pet_status = hotel_info.pet_policy.get('allowed', 'Unknown') if isinstance(hotel_info.pet_policy, dict) else hotel_info.pet_policy
-                f.write(f"Pet Policy: {pet_status}\n")
-            f.write("\n")
-            
-            # Parking and Transportation
-            f.write("PARKING AND TRANSPORTATION\n")
-            f.write("-" * 26 + "\n")
-            if hotel_info.parking_available:
-                f.write("Parking: Available\n")
-                if hotel_info.parking_cost:
-                    f.write(f"Parking Cost: {hotel_info.parking_cost}\n")
-                if hotel_info.parking_type:
-                    f.write(f"Parking Type: {hotel_info.parking_type}\n")
+        buf = io.StringIO()
+        # Header with metadata
+        buf.write(f"HOTEL INFORMATION PROFILE\n")
+        buf.write(f"{'=' * 50}\n\n")
+        buf.write(f"Hotel Name: {hotel_info.hotel_name}\n")
+        buf.write(f"Website: {hotel_info.website_url}\n")
+        buf.write(f"Data Quality Score: {confidence_str}/1.0\n")
+        buf.write(f"Last Updated: {scraped_at_str}\n")
+        
+        if hotel_info.sentiment_score is not None:
+            sentiment_text = "Positive" if hotel_info.sentiment_score > 0.6 else "Neutral" if hotel_info.sentiment_score > 0.4 else "Negative"
+            buf.write(f"Content Sentiment: {sentiment_text} ({hotel_info.sentiment_score:.2f})\n")
+        
+        buf.write(f"\n{'=' * 50}\n\n")
+        
+        # Contact Information
+        buf.write("CONTACT AND LOCATION\n")
+        buf.write("-" * 20 + "\n")
+        if hotel_info.phone:
+            buf.write(f"Phone: {hotel_info.phone}\n")
+        if hotel_info.email:
+            buf.write(f"Email: {hotel_info.email}\n")
+        if hotel_info.address:
+            buf.write(f"Address: {hotel_info.address}\n")
+        if hotel_info.city and hotel_info.state:
+            buf.write(f"Location: {hotel_info.city}, {hotel_info.state}\n")
+        buf.write("\n")
+        
+        # Policies
+        buf.write("HOTEL POLICIES\n")
+        buf.write("-" * 14 + "\n")
+        if hotel_info.checkin_time:
+            buf.write(f"Check-in Time: {hotel_info.checkin_time}\n")
+        if hotel_info.checkout_time:
+            buf.write(f"Check-out Time: {hotel_info.checkout_time}\n")
+        if hotel_info.cancellation_policy:
+            buf.write(f"Cancellation Policy: {hotel_info.cancellation_policy}\n")
+        if hotel_info.pet_policy:
+            pet_status = hotel_info.pet_policy.get('allowed', 'Unknown') if isinstance(hotel_info.pet_policy, dict) else hotel_info.pet_policy
+            buf.write(f"Pet Policy: {pet_status}\n")
+        buf.write("\n")
+        
+        # Parking and Transportation
+        buf.write("PARKING AND TRANSPORTATION\n")
+        buf.write("-" * 26 + "\n")
+        if hotel_info.parking_available:
+            buf.write("Parking: Available\n")
+            if hotel_info.parking_cost:
+                buf.write(f"Parking Cost: {hotel_info.parking_cost}\n")
+            if hotel_info.parking_type:
+                buf.write(f"Parking Type: {hotel_info.parking_type}\n")
+        else:
+            buf.write("Parking: Information not available\n")
+        
+        if hotel_info.shuttle_service:
+            buf.write(f"Shuttle Service: {hotel_info.shuttle_service}\n")
+        if hotel_info.distance_to_airport:
+            buf.write(f"Airport Distance: {hotel_info.distance_to_airport}\n")
+        buf.write("\n")
+        
+        # Amenities
+        buf.write("HOTEL AMENITIES\n")
+        buf.write("-" * 15 + "\n")
+        if hotel_info.wifi_info:
+            buf.write(f"WiFi: {hotel_info.wifi_info}\n")
+        
+        if hotel_info.fitness_center:
+            if isinstance(hotel_info.fitness_center, dict):
+                buf.write(f"Fitness Center: Available - {hotel_info.fitness_center.get('details', '')}\n")
             else:
-                f.write("Parking: Information not available\n")
-            
-            if hotel_info.shuttle_service:
-                f.write(f"Shuttle Service: {hotel_info.shuttle_service}\n")
-            if hotel_info.distance_to_airport:
-                f.write(f"Airport Distance: {hotel_info.distance_to_airport}\n")
-            f.write("\n")
+                buf.write("Fitness Center: Available\n")
+        
+        if hotel_info.pool:
+            if isinstance(hotel_info.pool, dict):
+                pool_type = hotel_info.pool.get('type', 'Standard')
+                buf.write(f"Pool: {pool_type} pool available\n")
+            else:
+                buf.write("Pool: Available\n")
+        
+        if hotel_info.spa_services:
+            buf.write(f"Spa Services: {', '.join(hotel_info.spa_services)}\n")
+        
+        if hotel_info.accessibility_features:
+            buf.write(f"Accessibility: {', '.join(hotel_info.accessibility_features)}\n")
+        buf.write("\n")
+        
+        # Dining
+        if hotel_info.restaurants or hotel_info.room_service or hotel_info.breakfast_info:
+            buf.write("DINING OPTIONS\n")
+            buf.write("-" * 14 + "\n")
             
-            # Amenities
-            f.write("HOTEL AMENITIES\n")
-            f.write("-" * 15 + "\n")
-            if hotel_info.wifi_info:
-                f.write(f"WiFi: {hotel_info.wifi_info}\n")
+            if hotel_info.restaurants:
+                buf.write("Restaurants:\n")
+                for restaurant in hotel_info.restaurants:
+                    name = restaurant.get('name', 'Restaurant')
+                    cuisine = restaurant.get('cuisine', '')
+                    hours = restaurant.get('hours', '')
+                    buf.write(f"  • {name}")
+                    if cuisine:
+                        buf.write(f" ({cuisine})")
+                    if hours:
+                        buf.write(f" - {hours}")
+                    buf.write("\n")
             
-            if hotel_info.fitness_center:
-                if isinstance(hotel_info.fitness_center, dict):
-                    f.write(f"Fitness Center: Available - {hotel_info.fitness_center.get('details', '')}\n")
+            if hotel_info.room_service:
+                if isinstance(hotel_info.room_service, dict):
+                    hours = hotel_info.room_service.get('hours', 'Available')
+                    buf.write(f"Room Service: {hours}\n")
                 else:
-                    f.write("Fitness Center: Available\n")
+                    buf.write(f"Room Service: {hotel_info.room_service}\n")
             
-            if hotel_info.pool:
-                if isinstance(hotel_info.pool, dict):
-                    pool_type = hotel_info.pool.get('type', 'Standard')
-                    f.write(f"Pool: {pool_type} pool available\n")
+            if hotel_info.breakfast_info:
+                if isinstance(hotel_info.breakfast_info, dict):
+                    bfast_type = hotel_info.breakfast_info.get('type', 'Available')
+                    cost = hotel_info.breakfast_info.get('cost', '')
+                    buf.write(f"Breakfast: {bfast_type}")
+                    if cost:
+                        buf.write(f" - {cost}")
+                    buf.write("\n")
                 else:
-                    f.write("Pool: Available\n")
-            
-            if hotel_info.spa_services:
-                f.write(f"Spa Services: {', '.join(hotel_info.spa_services)}\n")
-            
-            if hotel_info.accessibility_features:
-                f.write(f"Accessibility: {', '.join(hotel_info.accessibility_features)}\n")
-            f.write("\n")
+                    buf.write(f"Breakfast: {hotel_info.breakfast_info}\n")
+            buf.write("\n")
+        
+        # Room Information
+        if hotel_info.room_types or hotel_info.room_amenities:
+            buf.write("ROOM INFORMATION\n")
+            buf.write("-" * 16 + "\n")
             
-            # Dining
-            if hotel_info.restaurants or hotel_info.room_service or hotel_info.breakfast_info:
-                f.write("DINING OPTIONS\n")
-                f.write("-" * 14 + "\n")
-                
-                if hotel_info.restaurants:
-                    f.write("Restaurants:\n")
-                    for restaurant in hotel_info.restaurants:
-                        name = restaurant.get('name', 'Restaurant')
-                        cuisine = restaurant.get('cuisine', '')
-                        hours = restaurant.get('hours', '')
-                        f.write(f"  • {name}")
-                        if cuisine:
-                            f.write(f" ({cuisine})")
-                        if hours:
-                            f.write(f" - {hours}")
-                        f.write("\n")
-                
-                if hotel_info.room_service:
-                    if isinstance(hotel_info.room_service, dict):
-                        hours = hotel_info.room_service.get('hours', 'Available')
-                        f.write(f"Room Service: {hours}\n")
-                    else:
-                        f.write(f"Room Service: {hotel_info.room_service}\n")
-                
-                if hotel_info.breakfast_info:
-                    if isinstance(hotel_info.breakfast_info, dict):
-                        bfast_type = hotel_info.breakfast_info.get('type', 'Available')
-                        cost = hotel_info.breakfast_info.get('cost', '')
-                        f.write(f"Breakfast: {bfast_type}")
-                        if cost:
-                            f.write(f" - {cost}")
-                        f.write("\n")
-                    else:
-                        f.write(f"Breakfast: {hotel_info.breakfast_info}\n")
-                f.write("\n")
+            if hotel_info.room_types:
+                buf.write("Room Types:\n")
+                for room in hotel_info.room_types:
+                    room_type = room.get('type', 'Room')
+                    description = room.get('description', '')
+                    buf.write(f"  • {room_type}")
+                    if description:
+                        buf.write(f": {description[:100]}...")
+                    buf.write("\n")
             
-            # Room Information
-            if hotel_info.room_types or hotel_info.room_amenities:
-                f.write("ROOM INFORMATION\n")
-                f.write("-" * 16 + "\n")
-                
-                if hotel_info.room_types:
-                    f.write("Room Types:\n")
-                    for room in hotel_info.room_types:
-                        room_type = room.get('type', 'Room')
-                        description = room.get('description', '')
-                        f.write(f"  • {room_type}")
-                        if description:
-                            f.write(f": {description[:100]}...")
-                        f.write("\n")
-                
-                if hotel_info.room_amenities:
-                    f.write(f"Room Amenities: {', '.join(hotel_info.room_amenities)}\n")
-                f.write("\n")
+            if hotel_info.room_amenities:
+                buf.write(f"Room Amenities: {', '.join(hotel_info.room_amenities)}\n")
+            buf.write("\n")
+        
+        # Nearby Attractions
+        if hotel_info.nearby_attractions:
+            buf.write("NEARBY ATTRACTIONS\n")
+            buf.write("-" * 18 + "\n")
+            for attraction in hotel_info.nearby_attractions:
+                if isinstance(attraction, dict):
+                    name = attraction.get('name', 'Attraction')
+                    distance = attraction.get('distance', '')
+                    buf.write(f"  • {name}")
+                    if distance and distance != 'Unknown':
+                        buf.write(f" ({distance})")
+                    buf.write("\n")
+                else:
+                    buf.write(f"  • {attraction}\n")
+            buf.write("\n")
+        
+        # AI Insights
+        if hotel_info.key_selling_points or hotel_info.target_audience:
+            buf.write("AI-GENERATED INSIGHTS\n")
+            buf.write("-" * 21 + "\n")
             
-            # Nearby Attractions
-            if hotel_info.nearby_attractions:
-                f.write("NEARBY ATTRACTIONS\n")
-                f.write("-" * 18 + "\n")
-                for attraction in hotel_info.nearby_attractions:
-                    if isinstance(attraction, dict):
-                        name = attraction.get('name', 'Attraction')
-                        distance = attraction.get('distance', '')
-                        f.write(f"  • {name}")
-                        if distance and distance != 'Unknown':
-                            f.write(f" ({distance})")
-                        f.write("\n")
-                    else:
-                        f.write(f"  • {attraction}\n")
-                f.write("\n")
+            if hotel_info.key_selling_points:
+                buf.write(f"Key Features: {', '.join(hotel_info.key_selling_points)}\n")
             
-            # AI Insights
-            if hotel_info.key_selling_points or hotel_info.target_audience:
-                f.write("AI-GENERATED INSIGHTS\n")
-                f.write("-" * 21 + "\n")
-                
-                if hotel_info.key_selling_points:
-                    f.write(f"Key Features: {', '.join(hotel_info.key_selling_points)}\n")
-                
-                if hotel_info.target_audience:
-                    f.write(f"Target Audience: {', '.join(hotel_info.target_audience)}\n")
-                
-                if hotel_info.price_range_indicator:
-                    f.write(f"Price Range: {hotel_info.price_range_indicator}\n")
-                
-                if hotel_info.unique_features:
-                    f.write(f"Unique Features: {', '.join(hotel_info.unique_features)}\n")
-                f.write("\n")
+            if hotel_info.target_audience:
+                buf.write(f"Target Audience: {', '.join(hotel_info.target_audience)}\n")
             
-            # Services
-            if hotel_info.concierge_services:
-                f.write("ADDITIONAL SERVICES\n")
-                f.write("-" * 19 + "\n")
-                for service in hotel_info.concierge_services:
-                    f.write(f"  • {service}\n")
-                f.write("\n")
+            if hotel_info.price_range_indicator:
+                buf.write(f"Price Range: {hotel_info.price_range_indicator}\n")
             
-            # Footer
-            f.write("=" * 50 + "\n")
-            f.write("This data was extracted using AI-enhanced web scraping\n")
-            f.write(f"Confidence Score: {hotel_info.confidence_score:.2f} (higher is better)\n")
-            f.write("For the most current information, please contact the hotel directly.\n")
+            if hotel_info.unique_features:
+                buf.write(f"Unique Features: {', '.join(hotel_info.unique_features)}\n")
+            buf.write("\n")
+        
+        # Services
+        if hotel_info.concierge_services:
+            buf.write("ADDITIONAL SERVICES\n")
+            buf.write("-" * 19 + "\n")
+            for service in hotel_info.concierge_services:
+                buf.write(f"  • {service}\n")
+            buf.write("\n")
+        
+        # Footer
+        buf.write("=" * 50 + "\n")
+        buf.write("This data was extracted using AI-enhanced web scraping\n")
+        buf.write(f"Confidence Score: {confidence_str} (higher is better)\n")
+        buf.write("For the most current information, please contact the hotel directly.\n")
         
+        filepath.write_bytes(buf.getvalue().encode('utf-8'))
         return filepath
     
-    def _export_markdown(self, hotel_info: IntelligentHotelInfo, filename: str) -> Path:
+    def _export_markdown(self, hotel_info: IntelligentHotelInfo, filename: str,
+                         scraped_at_str: Optional[str] = None,
+                         confidence_str: Optional[str] = None) -> Path:
         """Export as Markdown documentation"""
         filepath = self.output_dir / filename
+        if scraped_at_str is None:
+            scraped_at_str = str(hotel_info.scraped_at)
+        if confidence_str is None:
+            confidence_str = f"{hotel_info.confidence_score:.2f}"
         
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write(f"# {hotel_info.hotel_name}\n\n")
             f.write(f"**Website:** {hotel_info.website_url}  \n")
-            f.write(f"**Data Quality Score:** {hotel_info.confidence_score:.2f}/1.0  \n")
-            f.write(f"**Last Updated:** {hotel_info.scraped_at}  \n\n")
+            f.write(f"**Data Quality Score:** {confidence_str}/1.0  \n")
+            f.write(f"**Last Updated:** {scraped_at_str}  \n\n")
             
             if hotel_info.key_selling_points:
                 f.write("## 🌟 Key Features\n\n")
@@ -390,9 +497,12 @@ class IntelligentDataExporter:
         
         return filepath
     
-    def _export_summary(self, hotel_info: IntelligentHotelInfo, filename: str) -> Path:
+    def _export_summary(self, hotel_info: IntelligentHotelInfo, filename: str,
+                        scraped_at_str: Optional[str] = None) -> Path:
         """Export concise summary for quick reference"""
         filepath = self.output_dir / filename
+        if scraped_at_str is None:
+            scraped_at_str = str(hotel_info.scraped_at)
         
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write(f"HOTEL SUMMARY: {hotel_info.hotel_name}\n")
@@ -445,7 +555,7 @@ class IntelligentDataExporter:
                 f.write(f"KEY FEATURES: {', '.join(hotel_info.key_selling_points)}\n\n")
             
             f.write(f"DATA QUALITY: {hotel_info.confidence_score:.0%}\n")
-            f.write(f"SCRAPED: {hotel_info.scraped_at}\n")
+            f.write(f"SCRAPED: {scraped_at_str}\n")
         
         return filepath
     
@@ -8,18 +8,24 @@ semantic analysis, and intelligent data structuring for RAG systems.
 import json
 import logging
 import asyncio
+import threading
 import aiohttp
 import os
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 from dataclasses import dataclass, asdict
+from contextlib import contextmanager
+from functools import lru_cache
 import re
 import time
 import random
 
+import numpy as np
 import requests
 from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
@@ -45,6 +51,48 @@ except ImportError:
     SENTENCE_TRANSFORMERS_AVAILABLE = False
     print("⚠️  Sentence Transformers not available - using basic semantic analysis")
 
+try:
+    import onnxruntime
+    ONNX_RUNTIME_AVAILABLE = True
+except ImportError:
+    ONNX_RUNTIME_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from selectolax.parser import HTMLParser as SelectolaxParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+try:
+    import bitsandbytes  # noqa: F401
+    BITSANDBYTES_AVAILABLE = True
+except ImportError:
+    BITSANDBYTES_AVAILABLE = False
+
 import spacy
 from textstat import flesch_reading_ease
 import pandas as pd
@@ -52,11 +100,26 @@ from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+# Prefer the libuv-based event loop when available; scraping fans out many
+# concurrent tasks per page, where uvloop's lower overhead pays off
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 console = Console()
 
+# User agents shared by the HTTP session and the Selenium fallback
+USER_AGENTS = [
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+]
+
 # Free AI configuration
 USE_FREE_AI = os.getenv('USE_FREE_AI', 'true').lower() == 'true'
 HUGGINGFACE_TOKEN = os.getenv('HUGGINGFACE_TOKEN')  # Optional for free models
@@ -64,6 +127,7 @@ HUGGINGFACE_TOKEN = os.getenv('HUGGINGFACE_TOKEN')  # Optional for free models
 # Conditional OpenAI import
 try:
     import openai
+    import httpx
     OPENAI_AVAILABLE = True
     # Configure OpenAI client
     openai_api_key = os.getenv('OPENAI_API_KEY')
@@ -79,7 +143,7 @@ except ImportError:
     if not USE_FREE_AI:
         logger.warning("OpenAI not available, falling back to free AI models")
 
-@dataclass
+@dataclass(slots=True)
 class IntelligentHotelInfo:
     """Enhanced hotel information with AI-extracted insights"""
     # Basic info
@@ -175,6 +239,445 @@ class IntelligentHotelInfo:
             if getattr(self, field) is None:
                 setattr(self, field, [])
 
+# Confidence-score weights in the same order as the values array built by
+# _calculate_confidence_score: hotel_name, phone, address, checkin, checkout,
+# parking, wifi, restaurants, attractions, room_types, amenities, policies,
+# services
+_CONF_WEIGHTS = np.array([0.1, 0.08, 0.08, 0.07, 0.07, 0.05, 0.05,
+                          0.1, 0.08, 0.08, 0.1, 0.08, 0.06], dtype=np.float32)
+
+def _conf_score(values):
+    """Weighted completeness score over the fixed field-ratio array"""
+    score = 0.0
+    for i in range(values.shape[0]):
+        score += _CONF_WEIGHTS[i] * values[i]
+    return min(score, 1.0)
+
+if NUMBA_AVAILABLE:
+    # Cold compile happens once per install thanks to cache=True; the
+    # explicit signature compiles eagerly and skips per-call dispatch,
+    # which matters when re-scoring results in bulk
+    _conf_score = numba.njit("float64(float32[::1])", cache=True)(_conf_score)
+
+# Class/id hints for section-scoped extraction; matching a dedicated
+# policies/amenities/dining subtree avoids sweeping the whole page text
+try:
+    import tiktoken
+    _TIKTOKEN_ENC = tiktoken.get_encoding("cl100k_base")
+except ImportError:
+    _TIKTOKEN_ENC = None
+
+@lru_cache(maxsize=256)
+def _token_trim(text: str, n_tokens: int = 1500) -> str:
+    """Trim text to a real token budget rather than a character count
+
+    Memoized so the fused and per-type extraction paths don't re-tokenize
+    the same page content. Falls back to character slicing without tiktoken.
+    """
+    if _TIKTOKEN_ENC is None:
+        return text[:n_tokens * 2]
+    ids = _TIKTOKEN_ENC.encode(text)
+    if len(ids) <= n_tokens:
+        return text
+    return _TIKTOKEN_ENC.decode(ids[:n_tokens])
+
+def _json_loads(text):
+    """Parse JSON with orjson when available, stdlib json otherwise"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+# Fields counted in the vectorized batch completeness score
+_SCORING_FIELDS = [
+    'phone', 'email', 'address', 'checkin_time', 'checkout_time',
+    'parking_available', 'wifi_info', 'cancellation_policy',
+    'fitness_center', 'pool', 'pet_policy', 'room_service', 'breakfast_info',
+]
+
+_SECTION_HINTS = {
+    'policies': re.compile(r'polic|check[- ]?in|check[- ]?out', re.I),
+    'amenities': re.compile(r'amenit|facilit', re.I),
+    'dining': re.compile(r'dining|restaurant|breakfast', re.I),
+}
+
+# Compiled XPath expressions for hotel-name extraction, in priority order.
+# Each returns a plain string so libxml2 does the DOM walking in C.
+_NAME_XPATHS = [
+    etree.XPath("normalize-space(//h1[1])"),
+    etree.XPath("normalize-space((//*[contains(@data-testid, 'hotel')])[1])"),
+    etree.XPath("normalize-space((//*[contains(@class, 'hotel-name') or contains(@class, 'property-name')])[1])"),
+    etree.XPath("string(//meta[@property='og:title']/@content)"),
+    etree.XPath("string(//meta[@name='twitter:title']/@content)"),
+    etree.XPath("normalize-space(//title)"),
+    etree.XPath("normalize-space((//*[contains(@itemtype, 'Hotel')]//*[@itemprop='name'])[1])"),
+]
+
+# JSON schema for the single fused OpenAI extraction call; one completion
+# returns what previously took four prompt+completion round trips
+_NULLABLE_STR = {"type": ["string", "null"]}
+_STR_ARRAY = {"type": "array", "items": {"type": "string"}}
+
+FUSED_EXTRACTION_SCHEMA = {
+    "type": "object",
+    "additionalProperties": False,
+    "required": ["hotel_info", "policies", "amenities", "dining"],
+    "properties": {
+        "hotel_info": {
+            "type": "object",
+            "additionalProperties": False,
+            "required": ["hotel_name", "phone", "email", "address", "city", "state", "zip_code"],
+            "properties": {
+                "hotel_name": _NULLABLE_STR, "phone": _NULLABLE_STR,
+                "email": _NULLABLE_STR, "address": _NULLABLE_STR,
+                "city": _NULLABLE_STR, "state": _NULLABLE_STR,
+                "zip_code": _NULLABLE_STR,
+            },
+        },
+        "policies": {
+            "type": "object",
+            "additionalProperties": False,
+            "required": ["checkin_time", "checkout_time", "cancellation_policy",
+                         "deposit_policy", "age_restrictions", "early_checkin_policy",
+                         "late_checkout_policy"],
+            "properties": {
+                "checkin_time": _NULLABLE_STR, "checkout_time": _NULLABLE_STR,
+                "cancellation_policy": _NULLABLE_STR, "deposit_policy": _NULLABLE_STR,
+                "age_restrictions": _NULLABLE_STR, "early_checkin_policy": _NULLABLE_STR,
+                "late_checkout_policy": _NULLABLE_STR,
+            },
+        },
+        "amenities": {
+            "type": "object",
+            "additionalProperties": False,
+            "required": ["amenities", "business_services", "recreational_services",
+                         "accessibility_features"],
+            "properties": {
+                "amenities": _STR_ARRAY, "business_services": _STR_ARRAY,
+                "recreational_services": _STR_ARRAY, "accessibility_features": _STR_ARRAY,
+            },
+        },
+        "dining": {
+            "type": "object",
+            "additionalProperties": False,
+            "required": ["restaurants", "bars_lounges", "room_service", "breakfast_info"],
+            "properties": {
+                "restaurants": _STR_ARRAY, "bars_lounges": _STR_ARRAY,
+                "room_service": _NULLABLE_STR, "breakfast_info": _NULLABLE_STR,
+            },
+        },
+    },
+}
+
+# Path to the int8-quantized MiniLM ONNX export; generated offline with
+#   optimum-cli export onnx --model sentence-transformers/all-MiniLM-L6-v2 minilm_onnx/
+#   quantize_dynamic('minilm_onnx/model.onnx', 'minilm_int8.onnx', weight_type=QuantType.QInt8)
+MINILM_INT8_ONNX = os.getenv('MINILM_INT8_ONNX', 'minilm_int8.onnx')
+
+# Semantic prompt cache: reuse an OpenAI response when a new page's content
+# embeds within this cosine similarity of an already-answered one
+SEM_CACHE_SIM_THRESHOLD = 0.87
+SEM_CACHE_MAX_ENTRIES = 5000
+
+# Amenity categories scanned for in page text, shared by the Aho-Corasick
+# automaton and the substring fallback
+AMENITY_CATEGORIES = {
+    'wifi': ['wifi', 'wi-fi', 'internet', 'wireless'],
+    'fitness': ['fitness', 'gym', 'exercise', 'workout'],
+    'pool': ['pool', 'swimming', 'aquatic'],
+    'spa': ['spa', 'massage', 'wellness', 'treatment'],
+    'business': ['business center', 'meeting room', 'conference'],
+    'pets': ['pet', 'dog', 'cat', 'animal'],
+    'accessibility': ['accessible', 'wheelchair', 'ada', 'disability']
+}
+
+SERVICE_CATEGORIES = {
+    'concierge': ['concierge', 'guest services', 'front desk'],
+    'laundry': ['laundry', 'dry cleaning', 'valet service'],
+    'luggage': ['luggage storage', 'baggage', 'bell hop'],
+    'transportation': ['shuttle', 'car service', 'taxi', 'uber'],
+    'meeting': ['meeting room', 'conference', 'event space'],
+    'wellness': ['spa', 'massage', 'wellness center']
+}
+
+BREAKFAST_KEYWORDS = ['breakfast', 'morning meal', 'continental breakfast']
+BASIC_AMENITY_KEYWORDS = ['pool', 'wifi', 'parking', 'gym', 'spa', 'restaurant', 'bar', 'fitness']
+
+# Every keyword bag that gets scanned against the full page text, keyed by a
+# bag tag; one Aho-Corasick pass over the page replaces the per-bag scans
+_PAGE_KEYWORD_BAGS = {f'service:{cat}': kws for cat, kws in SERVICE_CATEGORIES.items()}
+_PAGE_KEYWORD_BAGS['breakfast'] = BREAKFAST_KEYWORDS
+_PAGE_KEYWORD_BAGS['basic_amenity'] = BASIC_AMENITY_KEYWORDS
+_PAGE_KEYWORD_BAGS['room_service'] = ['room service']
+
+# Pre-compiled extraction patterns; compiling once at import avoids the
+# per-call re-cache lookup inside the extractor loops. Email and phone are
+# fused into one alternation so the page text is walked a single time for
+# both; named groups say which branch matched
+_CONTACT_RE = re.compile(
+    r'(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b)'
+    r'|(?P<phone>\b(?:\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}\b)'
+)
+_COST_RE = re.compile(r'\$(\d+(?:\.\d{2})?)')
+_HOURS_RE = re.compile(r'(\d{1,2}:?\d{0,2}\s*[ap]m.*?\d{1,2}:?\d{0,2}\s*[ap]m)')
+# Cheap pre-filter for nearby-venue extraction: a capitalized name followed
+# shortly by a venue keyword. Pages with few hits skip the spaCy NER pass
+_VENUE_RE = re.compile(
+    r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,3})\b[^.\n]{0,60}?'
+    r'\b(?i:(museum|park|theater|gallery|mall|restaurant|cafe|bar|bistro|market))\b'
+)
+# Flat keyword -> category map for nearby-entity bucketing; one dict lookup
+# per token replaces three any(...) keyword scans per entity
+_NEARBY_KW = {
+    'museum': 'Attraction', 'park': 'Attraction', 'theater': 'Attraction',
+    'gallery': 'Attraction', 'center': 'Attraction',
+    'restaurant': 'Restaurant', 'cafe': 'Restaurant', 'bar': 'Restaurant',
+    'bistro': 'Restaurant',
+    'mall': 'Shopping', 'shop': 'Shopping', 'market': 'Shopping',
+    'store': 'Shopping',
+}
+
+# One multi-alternation pass over the generator's KEY: value response plus a
+# setter dispatch table replaces per-line splitting and the elif chain
+_NAV_WORDS = frozenset({'overview', 'menu', 'click here', 'read more', 'view all'})
+
+_AI_LINE_RE = re.compile(
+    r'^\s*(HOTEL_NAME|ADDRESS|PHONE|EMAIL|CHECK_IN|CHECK_OUT|AMENITIES|DINING|'
+    r'SPA_SERVICES|NEARBY|POLICIES):\s*(.+?)\s*$', re.M)
+
+def _set_policies_from_ai(hotel_info, value):
+    if not hotel_info.cancellation_policy:
+        hotel_info.cancellation_policy = value
+
+_AI_SETTERS = {
+    'HOTEL_NAME': lambda h, v: setattr(h, 'hotel_name', v),
+    'ADDRESS': lambda h, v: setattr(h, 'address', v),
+    'PHONE': lambda h, v: setattr(h, 'phone', v),
+    'EMAIL': lambda h, v: setattr(h, 'email', v),
+    'CHECK_IN': lambda h, v: setattr(h, 'checkin_time', v),
+    'CHECK_OUT': lambda h, v: setattr(h, 'checkout_time', v),
+    'AMENITIES': lambda h, v: setattr(h, 'room_amenities', [a.strip() for a in v.split(',')]),
+    'DINING': lambda h, v: setattr(h, 'restaurants', [v]),
+    'SPA_SERVICES': lambda h, v: setattr(h, 'spa_services', [a.strip() for a in v.split(',')]),
+    'NEARBY': lambda h, v: setattr(h, 'nearby_attractions', [a.strip() for a in v.split(',')]),
+    'POLICIES': _set_policies_from_ai,
+}
+_RESTAURANT_CLS_RE = re.compile(r'restaurant|dining|food', re.I)
+_ROOM_CLS_RE = re.compile(r'room|suite|accommodation', re.I)
+_TIME_RES = {
+    'checkin': [re.compile(p) for p in (
+        r'check[- ]?in(?:\s+time)?:?\s*(\d{1,2}:?\d{0,2}\s*[ap]m)',
+        r'arrival(?:\s+time)?:?\s*(\d{1,2}:?\d{0,2}\s*[ap]m)',
+        r'checkin\s+(?:starts?|begins?)\s+(?:at\s+)?(\d{1,2}:?\d{0,2}\s*[ap]m)',
+    )],
+    'checkout': [re.compile(p) for p in (
+        r'check[- ]?out(?:\s+time)?:?\s*(\d{1,2}:?\d{0,2}\s*[ap]m)',
+        r'departure(?:\s+time)?:?\s*(\d{1,2}:?\d{0,2}\s*[ap]m)',
+        r'checkout\s+(?:is\s+)?(?:by\s+)?(\d{1,2}:?\d{0,2}\s*[ap]m)',
+    )],
+}
+
+class ORTMiniLMEncoder:
+    """Drop-in encode() backed by an int8 ONNX MiniLM for CPU inference"""
+
+    def __init__(self, model_path: str):
+        import numpy as np
+        from transformers import AutoTokenizer
+        self._np = np
+        self.tokenizer = AutoTokenizer.from_pretrained('sentence-transformers/all-MiniLM-L6-v2')
+        self.session = onnxruntime.InferenceSession(model_path, providers=["CPUExecutionProvider"])
+        self._input_names = {i.name for i in self.session.get_inputs()}
+
+    def encode(self, sentences, batch_size: int = 64, convert_to_numpy: bool = True,
+               normalize_embeddings: bool = False, **kwargs):
+        """Mean-pooled sentence embeddings, API-compatible with SentenceTransformer"""
+        np = self._np
+        if isinstance(sentences, str):
+            sentences = [sentences]
+
+        batches = []
+        for start in range(0, len(sentences), batch_size):
+            batch = sentences[start:start + batch_size]
+            enc = self.tokenizer(batch, padding=True, truncation=True,
+                                 max_length=256, return_tensors='np')
+            inputs = {k: v.astype(np.int64) for k, v in enc.items() if k in self._input_names}
+            hidden = self.session.run(None, inputs)[0]
+
+            # Attention-masked mean pooling over tokens
+            mask = enc['attention_mask'][..., None].astype(np.float32)
+            pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            batches.append(pooled)
+
+        vecs = np.concatenate(batches).astype(np.float32)
+        if normalize_embeddings:
+            vecs /= np.clip(np.linalg.norm(vecs, axis=1, keepdims=True), 1e-12, None)
+        return vecs
+
+
+class _NullProgress:
+    """No-op stand-in for a rich Progress when the live display is taken"""
+
+    def add_task(self, description, total=None):
+        return None
+
+    def update(self, task, **kwargs):
+        pass
+
+# rich permits one live display per console, so concurrent scrapes cannot
+# each open their own Progress: the first in-flight scrape gets the spinner
+# and the rest run with the no-op fallback (their progress still shows up in
+# the log lines). The flag flips synchronously on the event loop thread, so
+# no lock is needed.
+_PROGRESS_ACTIVE = False
+
+@contextmanager
+def _scrape_progress():
+    global _PROGRESS_ACTIVE
+    if _PROGRESS_ACTIVE:
+        yield _NullProgress()
+        return
+    _PROGRESS_ACTIVE = True
+    try:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console
+        ) as progress:
+            yield progress
+    finally:
+        _PROGRESS_ACTIVE = False
+
+def _page_settled(driver) -> bool:
+    """Document fully parsed and no resource fetch still in flight"""
+    return driver.execute_script(
+        "return document.readyState === 'complete' && "
+        "performance.getEntriesByType('resource')"
+        ".filter(r => r.responseEnd === 0).length === 0"
+    )
+
+# spaCy pipelines are not thread-safe (the tokenizer and Vocab mutate shared
+# caches during a call), and every scraper instance shares the _MODELS
+# singleton, so calls into it are serialized process-wide
+_NLP_LOCK = threading.Lock()
+
+# Process-wide AI model singletons: every scraper instance shares one copy of
+# the text generator, sentence encoder and spaCy pipeline
+_MODELS = {
+    "lock": threading.Lock(),
+    "loaded": False,
+    "text_generator": None,
+    "sentence_transformer": None,
+    "nlp": None,
+    "textstat": None,
+}
+
+def _load_models_once() -> Dict:
+    """Load the heavyweight AI models once per process
+
+    All IntelligentHotelScraper instances attach to the same model objects,
+    so per-URL scraper construction no longer re-pays model load time or RSS.
+    """
+    if _MODELS["loaded"]:  # Fast path once warm; dict reads are atomic
+        return _MODELS
+    with _MODELS["lock"]:
+        if _MODELS["loaded"]:
+            return _MODELS
+
+        logger.info("Initializing AI models in lightweight mode...")
+
+        # Check available AI libraries
+        if not TORCH_AVAILABLE:
+            logger.warning("PyTorch not available - advanced text generation disabled")
+        else:
+            # Check for GPU availability
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+            logger.info(f"Using device: {device}")
+
+            # Try to initialize text generation model
+            try:
+                if torch.cuda.is_available():
+                    # GPU available - use full model with GPU acceleration.
+                    # Decode is memory-bound, so int8 weights (when
+                    # bitsandbytes is installed) halve DRAM traffic again
+                    # over fp16 and shrink the footprint enough for larger
+                    # generation batches
+                    if BITSANDBYTES_AVAILABLE:
+                        precision_kwargs = {"model_kwargs": {"load_in_8bit": True}}
+                    else:
+                        precision_kwargs = {"torch_dtype": torch.float16}
+                    _MODELS["text_generator"] = pipeline(
+                        "text-generation",
+                        model="openai/gpt-oss-20b",
+                        token=HUGGINGFACE_TOKEN,
+                        device_map="auto",
+                        max_length=2048,
+                        do_sample=True,
+                        temperature=0.7,
+                        pad_token_id=50256,
+                        **precision_kwargs
+                    )
+                    logger.info("✅ GPT-oss-20b loaded successfully"
+                                + (" (int8)" if BITSANDBYTES_AVAILABLE else " (fp16)"))
+                else:
+                    # Use smaller CPU-friendly model
+                    _MODELS["text_generator"] = pipeline(
+                        "text-generation",
+                        model="distilgpt2",
+                        device=-1,  # CPU
+                        max_length=512
+                    )
+                    logger.info("✅ DistilGPT2 loaded for CPU")
+
+            except Exception as e:
+                logger.warning(f"Text generation model failed: {e}")
+
+        # Sentence transformer for embeddings
+        if not SENTENCE_TRANSFORMERS_AVAILABLE:
+            logger.warning("Sentence Transformers not available - using basic similarity")
+        else:
+            try:
+                device_for_st = "cuda" if TORCH_AVAILABLE and torch.cuda.is_available() else "cpu"
+                if (device_for_st == "cpu" and ONNX_RUNTIME_AVAILABLE
+                        and Path(MINILM_INT8_ONNX).exists()):
+                    # int8 ONNX path roughly doubles CPU embedding throughput
+                    _MODELS["sentence_transformer"] = ORTMiniLMEncoder(MINILM_INT8_ONNX)
+                    logger.info("✅ int8 ONNX sentence encoder loaded for CPU")
+                else:
+                    st = SentenceTransformer('all-MiniLM-L6-v2', device=device_for_st)
+                    if device_for_st == "cuda":
+                        # FP16 halves activation bandwidth; MiniLM forward is
+                        # memory-bound so throughput roughly doubles
+                        st.half()
+                        torch.backends.cuda.matmul.allow_tf32 = True
+                    _MODELS["sentence_transformer"] = st
+                    logger.info(f"✅ Sentence transformer loaded on {device_for_st}")
+            except Exception as e:
+                logger.warning(f"Sentence transformer failed: {e}")
+
+        # Simple NER with spaCy (lightweight)
+        try:
+            # Only ner (and its tok2vec) is used; skip the rest of the pipeline
+            _MODELS["nlp"] = spacy.load(
+                "en_core_web_sm",
+                disable=["tagger", "parser", "lemmatizer", "attribute_ruler"]
+            )
+            logger.info("✅ spaCy NER loaded")
+        except OSError:
+            logger.warning("spaCy model not found. Using basic text processing")
+
+        # Text statistics (lightweight)
+        try:
+            import textstat
+            _MODELS["textstat"] = textstat
+            logger.info("✅ Text statistics available")
+        except ImportError:
+            logger.info("Text statistics not available (optional)")
+
+        logger.info("🎉 AI models initialized (lightweight mode)")
+        _MODELS["loaded"] = True
+
+    return _MODELS
+
+
 class IntelligentHotelScraper:
     """AI-enhanced hotel scraper with semantic understanding"""
     
@@ -182,87 +685,192 @@ class IntelligentHotelScraper:
         self.headless = headless
         self.use_ai = use_ai
         self.driver = None
-        
+        self._session = None  # Shared aiohttp session, created lazily
+        self._sem_cache = {}  # extraction_type -> {'vecs', 'responses', 'exact'}
+        self._amenity_ac = self._build_amenity_automaton()
+        self._keyword_ac = self._build_keyword_automaton()
+        self._page_kw_hits = None  # Cached keyword-scan result for the current page
+        self._contact_hits = None  # Cached email/phone scan for the current page
+        self._section_elems = None  # Cached dining/room section walk for the current page
+        self._meaningful_text = None  # Cached meaningful-content text for the current page
+        self._llm_queue = None  # Prompt queue feeding the batched generator worker
+        self._llm_task = None
+        self._openai = None  # Shared AsyncOpenAI client, created lazily
+        self._openai_prefetch = {}  # Result of the fused extraction call
+        self._name_clean_cache = {}  # Memoized spaCy hotel-name cleanups
+        self._page_html = None  # Raw HTML of the current page, for lxml XPath
+        self._page_text = ""  # Cached page text, derived once per page
+        self._page_text_lower = ""
+        self._tab_pool = None  # asyncio.Queue of Chrome window handles
+        self._driver_lock = asyncio.Lock()  # Chromedriver is single-threaded
+        self._page_lock = asyncio.Lock()  # Per-page caches admit one page at a time
+        self._sync_loop = None  # Persistent loop backing the sync scrape_hotel API
+
         # Initialize AI models
         if self.use_ai:
             self._initialize_ai_models()
+
+    @staticmethod
+    def _build_amenity_automaton():
+        """Build the Aho-Corasick automaton over all amenity keywords"""
+        if not AHOCORASICK_AVAILABLE:
+            return None
+        automaton = ahocorasick.Automaton()
+        for category, keywords in AMENITY_CATEGORIES.items():
+            for keyword in keywords:
+                automaton.add_word(keyword, (category, keyword))
+        automaton.make_automaton()
+        return automaton
+
+    @staticmethod
+    def _build_keyword_automaton():
+        """Build one automaton over every whole-page keyword bag
+
+        A keyword can belong to several bags ('spa' is both a wellness
+        service and a basic amenity) and add_word overwrites the value for
+        a duplicate key, so each trie entry carries every (bag, keyword)
+        pair sharing that string.
+        """
+        if not AHOCORASICK_AVAILABLE:
+            return None
+        entries: Dict[str, list] = {}
+        for bag, keywords in _PAGE_KEYWORD_BAGS.items():
+            for keyword in keywords:
+                entries.setdefault(keyword, []).append((bag, keyword))
+        automaton = ahocorasick.Automaton()
+        for keyword, pairs in entries.items():
+            automaton.add_word(keyword, tuple(pairs))
+        automaton.make_automaton()
+        return automaton
+
+    def _classified_sections(self, soup: BeautifulSoup) -> Dict[str, list]:
+        """Bucket dining and room sections in one walk over the parse tree
+
+        The dining and room extractors previously ran separate find_all
+        sweeps and re-walked each subtree with get_text; this descends once,
+        extracts each matching element's text once, and caches the buckets
+        for the current page.
+        """
+        if self._section_elems is not None:
+            return self._section_elems
+        buckets = {'dining': [], 'room': []}
+        for element in soup.find_all(['div', 'section'], class_=True):
+            classes = ' '.join(element.get('class', ()))
+            text = None
+            if len(buckets['dining']) < 5 and _RESTAURANT_CLS_RE.search(classes):
+                text = element.get_text(strip=True)
+                buckets['dining'].append((element, text))
+            if len(buckets['room']) < 5 and _ROOM_CLS_RE.search(classes):
+                if text is None:
+                    text = element.get_text(strip=True)
+                buckets['room'].append((element, text))
+            if len(buckets['dining']) >= 5 and len(buckets['room']) >= 5:
+                break
+        self._section_elems = buckets
+        return buckets
+
+    def _scan_page_keywords(self, text: str) -> Dict[str, Dict[str, int]]:
+        """Map each bag to its keywords found in the page text, with offsets
+
+        One Aho-Corasick pass over the text covers all bags at once; each
+        hit records the end offset of the keyword's first occurrence so
+        context extraction can slice directly instead of re-searching. The
+        result is cached for the current page.
+        """
+        if text is self._page_text_lower and self._page_kw_hits is not None:
+            return self._page_kw_hits
+        hits: Dict[str, Dict[str, int]] = {}
+        if self._keyword_ac is not None:
+            for end, pairs in self._keyword_ac.iter(text):
+                for bag, keyword in pairs:
+                    hits.setdefault(bag, {}).setdefault(keyword, end)
+        else:
+            for bag, keywords in _PAGE_KEYWORD_BAGS.items():
+                for keyword in keywords:
+                    pos = text.find(keyword)
+                    if pos != -1:
+                        hits.setdefault(bag, {})[keyword] = pos + len(keyword) - 1
+        if text is self._page_text_lower:
+            self._page_kw_hits = hits
+        return hits
+
+    @staticmethod
+    def _context_at(text: str, end: int, keyword_len: int, context_size: int) -> str:
+        """Slice the context window around a known keyword end offset
+
+        Specialized companion to _extract_context_around_keyword for
+        callers that already hold an offset from the keyword scan: a pure
+        slice, no second search over the page.
+        """
+        start = max(0, end + 1 - keyword_len - context_size)
+        return text[start:end + 1 + context_size]
+
+    def _scan_contacts(self, text: str) -> Dict[str, str]:
+        """First email and first phone number in one pass over the page
+
+        The fused _CONTACT_RE alternation finds both in a single scan that
+        stops as soon as each kind has a hit, and the result is cached so
+        the AI and fallback extractors share one scan per page.
+        """
+        if text is self._page_text and self._contact_hits is not None:
+            return self._contact_hits
+        hits: Dict[str, str] = {}
+        for match in _CONTACT_RE.finditer(text):
+            hits.setdefault(match.lastgroup, match.group())
+            if len(hits) == 2:
+                break
+        if text is self._page_text:
+            self._contact_hits = hits
+        return hits
+
+    def _get_openai_client(self):
+        """Return the shared AsyncOpenAI client, creating it on first use
+
+        One client (and its pooled httpx transport) for the scraper's lifetime
+        amortizes TCP + TLS setup across all extraction calls.
+        """
+        if self._openai is None:
+            self._openai = openai.AsyncOpenAI(
+                api_key=os.getenv('OPENAI_API_KEY'),
+                http_client=httpx.AsyncClient(
+                    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                    timeout=30
+                )
+            )
+        return self._openai
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared aiohttp session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300),
+                headers={"User-Agent": random.choice(USER_AGENTS)}
+            )
+        return self._session
+
+    def _needs_browser(self, soup: BeautifulSoup) -> bool:
+        """Heuristic: does this page need a real browser to render?"""
+        body = soup.find('body')
+        if body is None:
+            return True
+        body_text = body.get_text(strip=True)
+        # Tiny body or noscript warnings usually mean a JS-rendered SPA
+        if len(body_text) < 500:
+            return True
+        noscript = soup.find('noscript')
+        if noscript and 'javascript' in noscript.get_text(strip=True).lower():
+            return True
+        return False
     
     def _initialize_ai_models(self):
-        """Initialize AI models with fallbacks for missing libraries"""
+        """Attach the process-wide shared AI models to this instance"""
         try:
-            logger.info("Initializing AI models in lightweight mode...")
-            
-            # Check available AI libraries
-            if not TORCH_AVAILABLE:
-                logger.warning("PyTorch not available - advanced text generation disabled")
-                self.text_generator = None
-            else:
-                # Check for GPU availability
-                device = "cuda" if torch.cuda.is_available() else "cpu"
-                logger.info(f"Using device: {device}")
-                
-                # Try to initialize text generation model
-                try:
-                    if torch.cuda.is_available():
-                        # GPU available - use full model with GPU acceleration
-                        self.text_generator = pipeline(
-                            "text-generation",
-                            model="openai/gpt-oss-20b",
-                            token=HUGGINGFACE_TOKEN,
-                            device_map="auto",
-                            torch_dtype=torch.float16,
-                            max_length=2048,
-                            do_sample=True,
-                            temperature=0.7,
-                            pad_token_id=50256
-                        )
-                        logger.info("✅ GPT-oss-20b loaded successfully")
-                    else:
-                        # Use smaller CPU-friendly model
-                        self.text_generator = pipeline(
-                            "text-generation",
-                            model="distilgpt2",
-                            device=-1,  # CPU
-                            max_length=512
-                        )
-                        logger.info("✅ DistilGPT2 loaded for CPU")
-                        
-                except Exception as e:
-                    logger.warning(f"Text generation model failed: {e}")
-                    self.text_generator = None
-            
-            # Sentence transformer for embeddings
-            if not SENTENCE_TRANSFORMERS_AVAILABLE:
-                logger.warning("Sentence Transformers not available - using basic similarity")
-                self.sentence_transformer = None
-            else:
-                try:
-                    device_for_st = "cuda" if TORCH_AVAILABLE and torch.cuda.is_available() else "cpu"
-                    self.sentence_transformer = SentenceTransformer('all-MiniLM-L6-v2', device=device_for_st)
-                    logger.info(f"✅ Sentence transformer loaded on {device_for_st}")
-                except Exception as e:
-                    logger.warning(f"Sentence transformer failed: {e}")
-                    self.sentence_transformer = None
-            
-            # Simple NER with spaCy (lightweight)
-            try:
-                self.nlp = spacy.load("en_core_web_sm")
-                logger.info("✅ spaCy NER loaded")
-            except OSError:
-                logger.warning("spaCy model not found. Using basic text processing")
-                self.nlp = None
-            
-            # Text statistics (lightweight)
-            try:
-                import textstat
-                self.textstat = textstat
-                logger.info("✅ Text statistics available")
-            except ImportError:
-                self.textstat = None
-                logger.info("Text statistics not available (optional)")
-            
-            logger.info("🎉 AI models initialized (lightweight mode)")
-            
+            models = _load_models_once()
+            self.text_generator = models["text_generator"]
+            self.sentence_transformer = models["sentence_transformer"]
+            self.nlp = models["nlp"]
+            self.textstat = models["textstat"]
+
         except Exception as e:
             logger.error(f"Failed to initialize AI models: {e}")
             logger.info("Continuing with basic extraction (no AI features)")
@@ -287,16 +895,12 @@ class IntelligentHotelScraper:
         chrome_options.add_argument("--disable-extensions")
         chrome_options.add_argument("--disable-plugins")
         chrome_options.add_argument("--disable-images")  # Faster loading
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         
         # Rotate user agents
-        user_agents = [
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        ]
-        chrome_options.add_argument(f"--user-agent={random.choice(user_agents)}")
+        chrome_options.add_argument(f"--user-agent={random.choice(USER_AGENTS)}")
         
         service = Service(ChromeDriverManager().install())
         self.driver = webdriver.Chrome(service=service, options=chrome_options)
@@ -308,90 +912,347 @@ class IntelligentHotelScraper:
     
     async def scrape_hotel_intelligent(self, url: str, hotel_name: str = None) -> IntelligentHotelInfo:
         """Intelligently scrape hotel with AI enhancement"""
-        if not self.driver:
-            self.setup_driver()
-        
         try:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                
+            with _scrape_progress() as progress:
+
                 task = progress.add_task(f"Scraping {url}...", total=None)
+
+                # Fast path: plain HTTP fetch for server-rendered pages.
+                # The raw HTML stays local until the page lock is held so a
+                # concurrent scrape cannot clobber it mid-fetch
+                soup = None
+                html = None
+                try:
+                    progress.update(task, description="Fetching page over HTTP...")
+                    session = await self._get_session()
+                    async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as response:
+                        fetched = await response.text()
+                    candidate = BeautifulSoup(fetched, 'lxml')
+                    if not self._needs_browser(candidate):
+                        soup = candidate
+                        html = fetched
+                except Exception as e:
+                    logger.info(f"Static fetch failed for {url}, falling back to browser: {e}")
+
+                # Slow path: JS-rendered pages need the real browser
+                if soup is None:
+                    soup, html = await self._fetch_page_with_browser(url, progress, task)
+
+                # Everything below reads and writes the per-page caches on
+                # the instance, so it runs under the page lock: concurrent
+                # scrape_many coroutines overlap their fetches above but take
+                # turns through extraction, keeping each page's state intact
+                async with self._page_lock:
+                    self._page_html = html
+
+                    # Derive page text once; every extractor reads these
+                    # instead of re-sweeping the DOM. selectolax (a C HTML
+                    # parser) pulls the text straight from raw HTML far
+                    # faster than walking the BS4 tree, so prefer it when the
+                    # raw source is at hand.
+                    self._page_text = ""
+                    if SELECTOLAX_AVAILABLE and self._page_html:
+                        try:
+                            body = SelectolaxParser(self._page_html).body
+                            if body is not None:
+                                self._page_text = body.text(separator=' ')
+                        except Exception:
+                            pass
+                    if not self._page_text:
+                        self._page_text = soup.get_text()
+                    self._page_text_lower = self._page_text.lower()
+                    self._page_kw_hits = None
+                    self._contact_hits = None
+                    self._section_elems = None
+                    self._meaningful_text = None
+
+                    # Initialize hotel info
+                    hotel_info = IntelligentHotelInfo(
+                        hotel_name=hotel_name or await self._extract_hotel_name_ai(soup),
+                        website_url=url,
+                        scraped_at=datetime.now().isoformat()
+                    )
+
+                    # One fused OpenAI call feeds all extractors instead of a
+                    # round trip per extraction type
+                    self._openai_prefetch = {}
+                    if USE_OPENAI_API and OPENAI_AVAILABLE:
+                        progress.update(task, description="Fused OpenAI extraction...")
+                        self._openai_prefetch = await self._extract_all_openai(
+                            self._extract_meaningful_content(soup))
+
+                    # AI-enhanced extraction with parallel processing.
+                    # Insight generation joins the gather: it writes disjoint
+                    # fields and its model call runs on a worker thread, so it
+                    # overlaps the soup-traversal extractors
+                    extraction_tasks = [
+                        self._extract_contact_info_ai(soup, hotel_info),
+                        self._extract_policies_ai(soup, hotel_info),
+                        self._extract_amenities_ai(soup, hotel_info),
+                        self._extract_dining_info_ai(soup, hotel_info),
+                        self._extract_nearby_info_ai(soup, hotel_info),
+                        self._extract_services_ai(soup, hotel_info),
+                        self._extract_room_info_ai(soup, hotel_info),
+                        self._generate_ai_insights(soup, hotel_info)
+                    ]
+
+                    progress.update(task, description="AI-enhanced content extraction...")
+                    await asyncio.gather(*extraction_tasks)
+
+                    progress.update(task, description="Calculating confidence score...")
+                    hotel_info.confidence_score = self._calculate_confidence_score(hotel_info)
+
+                    return hotel_info
                 
-                # Load page with retry mechanism
-                for attempt in range(3):
-                    try:
-                        progress.update(task, description=f"Loading page (attempt {attempt + 1})...")
+        except Exception as e:
+            logger.error(f"Error scraping {url}: {str(e)}")
+            raise
+    
+    def _init_tab_pool(self, size: int = 4):
+        """Pre-open a pool of tabs shared by concurrent scrape coroutines"""
+        self._tab_pool = asyncio.Queue()
+        while len(self.driver.window_handles) < size:
+            self.driver.execute_script("window.open()")
+        for handle in self.driver.window_handles[:size]:
+            self._tab_pool.put_nowait(handle)
+
+    async def _fetch_page_with_browser(self, url: str, progress: Progress, task):
+        """Load a JS-rendered page with Selenium; returns (soup, raw html)
+
+        Tabs come from a shared pool so concurrent coroutines reuse the one
+        browser; every driver interaction holds the lock and re-selects its
+        tab, since chromedriver serializes commands on the focused window.
+        """
+        if not self.driver:
+            self.setup_driver()
+        if self._tab_pool is None:
+            self._init_tab_pool()
+
+        handle = await self._tab_pool.get()
+        try:
+            page_source = None
+            # Load page with retry mechanism
+            for attempt in range(3):
+                try:
+                    progress.update(task, description=f"Loading page (attempt {attempt + 1})...")
+                    async with self._driver_lock:
+                        self.driver.switch_to.window(handle)
                         self.driver.get(url)
-                        
+
                         # Wait for content to load
                         WebDriverWait(self.driver, 15).until(
                             EC.presence_of_element_located((By.TAG_NAME, "body"))
                         )
-                        
-                        # Additional wait for dynamic content
-                        await asyncio.sleep(2)
-                        
-                        # Scroll to load lazy content
-                        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                        await asyncio.sleep(1)
-                        self.driver.execute_script("window.scrollTo(0, 0);")
-                        
-                        break
-                        
-                    except TimeoutException:
-                        if attempt == 2:
-                            raise
-                        await asyncio.sleep(2)
-                
-                progress.update(task, description="Parsing page content...")
-                soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-                
-                # Initialize hotel info
-                hotel_info = IntelligentHotelInfo(
-                    hotel_name=hotel_name or await self._extract_hotel_name_ai(soup),
-                    website_url=url,
-                    scraped_at=datetime.now().isoformat()
-                )
-                
-                # AI-enhanced extraction with parallel processing
-                extraction_tasks = [
-                    self._extract_contact_info_ai(soup, hotel_info),
-                    self._extract_policies_ai(soup, hotel_info),
-                    self._extract_amenities_ai(soup, hotel_info),
-                    self._extract_dining_info_ai(soup, hotel_info),
-                    self._extract_nearby_info_ai(soup, hotel_info),
-                    self._extract_services_ai(soup, hotel_info),
-                    self._extract_room_info_ai(soup, hotel_info)
-                ]
-                
-                progress.update(task, description="AI-enhanced content extraction...")
-                await asyncio.gather(*extraction_tasks)
-                
-                if self.use_ai:
-                    progress.update(task, description="Generating AI insights...")
-                    await self._generate_ai_insights(soup, hotel_info)
-                
-                progress.update(task, description="Calculating confidence score...")
-                hotel_info.confidence_score = self._calculate_confidence_score(hotel_info)
-                
-                return hotel_info
-                
-        except Exception as e:
-            logger.error(f"Error scraping {url}: {str(e)}")
-            raise
-    
+
+                        # Trigger lazy content, then wait until the document
+                        # settles instead of sleeping a fixed interval
+                        self.driver.execute_script(
+                            "window.scrollTo(0, document.body.scrollHeight);"
+                            " window.scrollTo(0, 0);"
+                        )
+                        try:
+                            WebDriverWait(self.driver, 10).until(_page_settled)
+                        except TimeoutException:
+                            # A long-polling beacon or websocket keeps
+                            # responseEnd at 0 forever; after the grace
+                            # period take the DOM as-is instead of treating
+                            # "never idle" as a failed load
+                            pass
+                        page_source = self.driver.page_source
+
+                    break
+
+                except TimeoutException:
+                    if attempt == 2:
+                        raise
+                    await asyncio.sleep(2)
+        finally:
+            self._tab_pool.put_nowait(handle)
+
+        progress.update(task, description="Parsing page content...")
+        return BeautifulSoup(page_source, 'lxml'), page_source
+
+    async def scrape_many(self, urls: List[str]) -> List[IntelligentHotelInfo]:
+        """Scrape a batch of hotel URLs concurrently, skipping failures
+
+        Network fetches overlap through the shared aiohttp session and the
+        browser tab pool; the extraction phase takes the page lock so the
+        per-page caches never mix two hotels. Failures are logged and
+        dropped from the result.
+        """
+        results = await asyncio.gather(
+            *(self.scrape_hotel_intelligent(url) for url in urls),
+            return_exceptions=True
+        )
+        infos = []
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to scrape {url}: {result}")
+            else:
+                infos.append(result)
+        return infos
+
+    @staticmethod
+    def batch_to_dataframe(infos: List[IntelligentHotelInfo]) -> pd.DataFrame:
+        """Columnar (SoA) view of a scraped batch
+
+        Each dataclass field becomes a DataFrame column, so batch metrics run
+        as vectorized column operations instead of per-object attribute
+        walks. Adds a field_completeness column (share of scoring fields that
+        are non-null) alongside the weighted confidence_score.
+        """
+        df = pd.DataFrame([asdict(h) for h in infos])
+        present = [f for f in _SCORING_FIELDS if f in df.columns]
+        if present:
+            df['field_completeness'] = df[present].notna().sum(axis=1) / len(present)
+        return df
+
+    def export_batch_parquet(self, infos: List[IntelligentHotelInfo],
+                             path: str = "hotels.parquet") -> str:
+        """Persist a scraped batch as zstd-compressed Parquet"""
+        df = self.batch_to_dataframe(infos)
+        df.to_parquet(path, compression="zstd")
+        return path
+
     def scrape_hotel(self, url: str, hotel_name: str = None) -> IntelligentHotelInfo:
-        """Synchronous wrapper for scrape_hotel_intelligent"""
-        return asyncio.run(self.scrape_hotel_intelligent(url, hotel_name))
+        """Synchronous wrapper for scrape_hotel_intelligent
+
+        Runs on one persistent private loop rather than asyncio.run: the
+        aiohttp session, tab pool and LLM worker bind to the loop that
+        created them, and a fresh loop per call would leave the second
+        call holding resources from a closed loop.
+        """
+        if self._sync_loop is None or self._sync_loop.is_closed():
+            self._sync_loop = asyncio.new_event_loop()
+        return self._sync_loop.run_until_complete(
+            self.scrape_hotel_intelligent(url, hotel_name))
     
+    def _sem_cache_bucket(self, extraction_type: str) -> Dict:
+        """Get (or create) the semantic cache bucket for an extraction type
+
+        With FAISS installed, similarity search runs through an IndexFlatIP
+        (inner product == cosine on normalized vectors); otherwise a plain
+        numpy matrix scan is used.
+        """
+        bucket = self._sem_cache.get(extraction_type)
+        if bucket is None:
+            bucket = {'responses': [], 'exact': {}}
+            if FAISS_AVAILABLE:
+                bucket['index'] = faiss.IndexFlatIP(384)
+            else:
+                bucket['vecs'] = np.empty((0, 384), np.float32)
+            self._sem_cache[extraction_type] = bucket
+        return bucket
+
+    def _sem_cache_lookup(self, extraction_type: str, snippet: str):
+        """Look up a cached response for semantically similar content
+
+        Returns (response, query_vec): response is None on a miss; query_vec
+        is the normalized embedding (or None without an encoder) so a later
+        store does not re-encode.
+        """
+        bucket = self._sem_cache_bucket(extraction_type)
+
+        # Exact-match fast path on the raw snippet hash
+        exact = bucket['exact'].get(hash(snippet))
+        if exact is not None:
+            return exact, None
+
+        if not (self.use_ai and self.sentence_transformer):
+            return None, None
+
+        q = self.sentence_transformer.encode([snippet], normalize_embeddings=True)[0]
+        q = np.asarray(q, np.float32)
+        if len(bucket['responses']):
+            if 'index' in bucket:
+                sims, idx = bucket['index'].search(q.reshape(1, -1), 1)
+                if idx[0, 0] >= 0 and sims[0, 0] >= SEM_CACHE_SIM_THRESHOLD:
+                    return bucket['responses'][int(idx[0, 0])], q
+            else:
+                sims = bucket['vecs'] @ q
+                best = int(sims.argmax())
+                if sims[best] >= SEM_CACHE_SIM_THRESHOLD:
+                    return bucket['responses'][best], q
+        return None, q
+
+    def _sem_cache_store(self, extraction_type: str, snippet: str, response: Dict, query_vec=None):
+        """Store a parsed OpenAI response in the semantic cache"""
+        bucket = self._sem_cache_bucket(extraction_type)
+        bucket['exact'][hash(snippet)] = response
+
+        if query_vec is None and self.use_ai and self.sentence_transformer:
+            query_vec = self.sentence_transformer.encode([snippet], normalize_embeddings=True)[0]
+        if query_vec is None:
+            return
+
+        query_vec = np.asarray(query_vec, np.float32).reshape(1, -1)
+        if 'index' in bucket:
+            bucket['index'].add(query_vec)
+        else:
+            bucket['vecs'] = np.concatenate([bucket['vecs'], query_vec])
+        bucket['responses'].append(response)
+
+        # Evict oldest entries once the bucket grows past the cap
+        if len(bucket['responses']) > SEM_CACHE_MAX_ENTRIES:
+            bucket['responses'].pop(0)
+            if 'index' in bucket:
+                kept = bucket['index'].reconstruct_n(1, bucket['index'].ntotal - 1)
+                bucket['index'].reset()
+                bucket['index'].add(kept)
+            else:
+                bucket['vecs'] = bucket['vecs'][1:]
+
+    async def _extract_all_openai(self, content: str) -> Dict:
+        """Fetch all extraction sections in one structured OpenAI call
+
+        A single json_schema-constrained completion returns the hotel_info,
+        policies, amenities and dining sections together, paying the prompt
+        tokens once instead of per extraction type.
+        """
+        if not USE_OPENAI_API or not OPENAI_AVAILABLE:
+            return {}
+
+        snippet = _token_trim(content)
+        cached, query_vec = self._sem_cache_lookup("fused", snippet)
+        if cached is not None:
+            return cached
+
+        try:
+            client = self._get_openai_client()
+            response = await client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "system",
+                     "content": "You are a hotel information extraction expert."},
+                    {"role": "user",
+                     "content": f"Extract hotel information from this webpage content.\n\nContent: {snippet}"}
+                ],
+                response_format={
+                    "type": "json_schema",
+                    "json_schema": {"name": "hotel", "schema": FUSED_EXTRACTION_SCHEMA,
+                                    "strict": True},
+                },
+                max_tokens=1500,
+                temperature=0.1
+            )
+            parsed = _json_loads(response.choices[0].message.content)
+            self._sem_cache_store("fused", snippet, parsed, query_vec)
+            return parsed
+
+        except Exception as e:
+            logger.error(f"Fused OpenAI extraction failed: {e}")
+            return {}
+
     async def _extract_with_openai(self, content: str, extraction_type: str, context: str = "") -> Dict:
         """Use OpenAI API for intelligent content extraction"""
         if not USE_OPENAI_API or not OPENAI_AVAILABLE:
             return {}
-            
+
+        snippet = _token_trim(content)
+        cached, query_vec = self._sem_cache_lookup(extraction_type, snippet)
+        if cached is not None:
+            return cached
+
         try:
             # Create extraction prompts based on type
             prompts = {
@@ -405,7 +1266,7 @@ Extract hotel information from this webpage content. Return a JSON object with t
 - state: State/province
 - zip_code: ZIP or postal code
 
-Content: {content[:3000]}
+Content: {snippet}
 
 Return only valid JSON:""",
 
@@ -419,7 +1280,7 @@ Extract hotel policies from this content. Return JSON with these fields:
 - early_checkin_policy: Early check-in information
 - late_checkout_policy: Late check-out information
 
-Content: {content[:3000]}
+Content: {snippet}
 
 Return only valid JSON:""",
 
@@ -430,7 +1291,7 @@ Extract hotel amenities and services from this content. Return JSON with these f
 - recreational_services: Array of recreational activities
 - accessibility_features: Array of accessibility features
 
-Content: {content[:3000]}
+Content: {snippet}
 
 Return only valid JSON:""",
 
@@ -441,7 +1302,7 @@ Extract dining information from this content. Return JSON with these fields:
 - room_service: Room service information
 - breakfast_info: Breakfast details and hours
 
-Content: {content[:3000]}
+Content: {snippet}
 
 Return only valid JSON:"""
             }
@@ -450,9 +1311,9 @@ Return only valid JSON:"""
             if not prompt:
                 return {}
                 
-            # Call OpenAI API
-            client = openai.OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-            response = client.chat.completions.create(
+            # Call OpenAI API through the shared keep-alive client
+            client = self._get_openai_client()
+            response = await client.chat.completions.create(
                 model="gpt-3.5-turbo",
                 messages=[
                     {"role": "system", "content": "You are a hotel information extraction expert. Always return valid JSON."},
@@ -471,9 +1332,11 @@ Return only valid JSON:"""
                     result_text = result_text.split("```json")[1].split("```")[0]
                 elif result_text.startswith("```"):
                     result_text = result_text.split("```")[1].split("```")[0]
-                    
-                return json.loads(result_text)
-            except json.JSONDecodeError:
+
+                parsed = _json_loads(result_text)
+                self._sem_cache_store(extraction_type, snippet, parsed, query_vec)
+                return parsed
+            except ValueError:  # json.JSONDecodeError and orjson.JSONDecodeError
                 logger.warning(f"Failed to parse OpenAI JSON response for {extraction_type}")
                 return {}
                 
@@ -481,9 +1344,47 @@ Return only valid JSON:"""
             logger.error(f"OpenAI extraction failed for {extraction_type}: {e}")
             return {}
 
+    def _nlp_call(self, text: str):
+        """Run the shared spaCy pipeline under the process-wide lock"""
+        with _NLP_LOCK:
+            return self.nlp(text)
+
+    def _clean_extracted_name(self, name: str) -> str:
+        """Clean a candidate hotel name with spaCy entity extraction
+
+        Results are memoized per name: chains repeat the same page titles
+        across properties and the spaCy pass is the expensive part.
+        """
+        cached = self._name_clean_cache.get(name)
+        if cached is not None:
+            return cached
+
+        cleaned = name
+        if self.use_ai and self.nlp:
+            doc = self._nlp_call(name[:500])
+            # Extract proper nouns that might be hotel names
+            entities = [ent.text for ent in doc.ents if ent.label_ in ["ORG", "GPE"]]
+            if entities:
+                cleaned = entities[0]
+
+        if len(self._name_clean_cache) < 4096:
+            self._name_clean_cache[name] = cleaned
+        return cleaned
+
     async def _extract_hotel_name_ai(self, soup: BeautifulSoup) -> str:
         """AI-enhanced hotel name extraction"""
-        # Multiple strategies for finding hotel name
+        # Fast path: compiled XPath over the raw HTML, walked by libxml2
+        if self._page_html:
+            try:
+                tree = lxml_html.fromstring(self._page_html)
+                for xp in _NAME_XPATHS:
+                    name = xp(tree).strip()
+                    if len(name) > 3:
+                        return self._clean_extracted_name(name)
+            except Exception:
+                pass
+
+        # Fallback: BeautifulSoup selector strategies
         strategies = [
             # Direct selectors
             lambda: soup.select_one('h1').get_text(strip=True) if soup.select_one('h1') else None,
@@ -503,109 +1404,61 @@ Return only valid JSON:"""
             try:
                 name = strategy()
                 if name and len(name) > 3:
-                    # Clean the name using AI if available
-                    if self.use_ai and self.nlp:
-                        doc = self.nlp(name)
-                        # Extract proper nouns that might be hotel names
-                        entities = [ent.text for ent in doc.ents if ent.label_ in ["ORG", "GPE"]]
-                        if entities:
-                            return entities[0]
-                    return name
+                    return self._clean_extracted_name(name)
             except:
                 continue
-        
+
         return "Unknown Hotel"
     
     async def _extract_contact_info_ai(self, soup: BeautifulSoup, hotel_info: IntelligentHotelInfo):
         """AI-enhanced contact information extraction"""
-        # Try OpenAI first if available
-        if USE_OPENAI_API and OPENAI_AVAILABLE:
-            content = self._extract_meaningful_content(soup)
-            openai_result = await self._extract_with_openai(content, "hotel_info")
-            
-            if openai_result:
-                # Update hotel info with OpenAI results
-                for field in ['phone', 'email', 'address', 'city', 'state', 'zip_code']:
-                    if field in openai_result and openai_result[field]:
-                        setattr(hotel_info, field, openai_result[field])
-                
-                # Also update hotel name if found
-                if 'hotel_name' in openai_result and openai_result['hotel_name']:
-                    hotel_info.hotel_name = openai_result['hotel_name']
-                
-                return  # OpenAI extraction successful, skip fallback
-        
-        # Fallback to traditional extraction methods
-        text = soup.get_text()
-        
-        if self.use_ai and self.nlp:
-            # Use NER to find contact information
-            doc = self.nlp(text[:2000])  # Limit text for performance
-            
-            for ent in doc.ents:
-                if ent.label_ == "PERSON" and '@' in ent.text:
-                    hotel_info.email = ent.text
-                elif ent.label_ in ["GPE", "LOC"] and not hotel_info.address:
-                    hotel_info.address = ent.text
-        
-        # Phone number extraction with improved patterns
-        phone_patterns = [
-            r'\b(?:\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})\b',
-            r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
-            r'\(\d{3}\)\s*\d{3}[-.]?\d{4}'
-        ]
-        
-        for pattern in phone_patterns:
-            match = re.search(pattern, text)
-            if match:
-                hotel_info.phone = match.group()
-                break
+        # Consume the fused OpenAI result if the prefetch produced one
+        openai_result = self._openai_prefetch.get("hotel_info") or {}
+        if openai_result:
+            for field in ['phone', 'email', 'address', 'city', 'state', 'zip_code']:
+                if field in openai_result and openai_result[field]:
+                    setattr(hotel_info, field, openai_result[field])
+
+            # Also update hotel name if found
+            if openai_result.get('hotel_name'):
+                hotel_info.hotel_name = openai_result['hotel_name']
+
+            return  # OpenAI extraction successful, skip fallback
         
-        # Email extraction
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        email_match = re.search(email_pattern, text)
-        if email_match and not hotel_info.email:
-            hotel_info.email = email_match.group()
+        # Fallback to regex extraction; spaCy NER added 200-400ms per page here
+        # and its PERSON/GPE guesses were overridden by the patterns anyway
+        text = self._page_text or soup.get_text()
+
+        # Phone and email come out of the shared single-pass contact scan
+        hits = self._scan_contacts(text)
+        if 'phone' in hits:
+            hotel_info.phone = hits['phone']
+        if 'email' in hits and not hotel_info.email:
+            hotel_info.email = hits['email']
     
     async def _extract_policies_ai(self, soup: BeautifulSoup, hotel_info: IntelligentHotelInfo):
         """AI-enhanced policy extraction"""
-        # Try OpenAI first if available
-        if USE_OPENAI_API and OPENAI_AVAILABLE:
-            content = self._extract_meaningful_content(soup)
-            openai_result = await self._extract_with_openai(content, "policies")
-            
-            if openai_result:
-                # Update hotel info with OpenAI results
-                policy_fields = [
-                    'checkin_time', 'checkout_time', 'cancellation_policy', 
-                    'deposit_policy', 'age_restrictions', 'early_checkin_policy', 
-                    'late_checkout_policy'
-                ]
-                for field in policy_fields:
-                    if field in openai_result and openai_result[field]:
-                        setattr(hotel_info, field, openai_result[field])
-                return  # OpenAI extraction successful, skip fallback
+        # Consume the fused OpenAI result if the prefetch produced one
+        openai_result = self._openai_prefetch.get("policies") or {}
+        if openai_result:
+            policy_fields = [
+                'checkin_time', 'checkout_time', 'cancellation_policy',
+                'deposit_policy', 'age_restrictions', 'early_checkin_policy',
+                'late_checkout_policy'
+            ]
+            for field in policy_fields:
+                if field in openai_result and openai_result[field]:
+                    setattr(hotel_info, field, openai_result[field])
+            return  # OpenAI extraction successful, skip fallback
         
-        # Fallback to traditional extraction
-        text = soup.get_text().lower()
+        # Fallback to traditional extraction, scoped to a policies section
+        # when the page has one
+        text = self._section_text(soup, 'policies') or self._page_text_lower or soup.get_text().lower()
         
         # Enhanced time extraction with context understanding
-        time_patterns = {
-            'checkin': [
-                r'check[- ]?in(?:\s+time)?:?\s*(\d{1,2}:?\d{0,2}\s*[ap]m)',
-                r'arrival(?:\s+time)?:?\s*(\d{1,2}:?\d{0,2}\s*[ap]m)',
-                r'checkin\s+(?:starts?|begins?)\s+(?:at\s+)?(\d{1,2}:?\d{0,2}\s*[ap]m)'
-            ],
-            'checkout': [
-                r'check[- ]?out(?:\s+time)?:?\s*(\d{1,2}:?\d{0,2}\s*[ap]m)',
-                r'departure(?:\s+time)?:?\s*(\d{1,2}:?\d{0,2}\s*[ap]m)',
-                r'checkout\s+(?:is\s+)?(?:by\s+)?(\d{1,2}:?\d{0,2}\s*[ap]m)'
-            ]
-        }
-        
-        for policy_type, patterns in time_patterns.items():
-            for pattern in patterns:
-                match = re.search(pattern, text)
+        for policy_type, patterns in _TIME_RES.items():
+            for time_re in patterns:
+                match = time_re.search(text)
                 if match:
                     if policy_type == 'checkin':
                         hotel_info.checkin_time = match.group(1)
@@ -626,11 +1479,29 @@ Return only valid JSON:"""
                 hotel_info.parking_type = "Self-park"
             
             # Extract parking cost if mentioned
-            cost_match = re.search(r'\$(\d+(?:\.\d{2})?)', parking_context)
+            cost_match = _COST_RE.search(parking_context)
             if cost_match:
                 hotel_info.parking_cost = f"${cost_match.group(1)}"
     
-    def _extract_context_around_keyword(self, text: str, keyword: str, context_size: int = 50) -> str:
+    def _section_text(self, soup: BeautifulSoup, section: str) -> Optional[str]:
+        """Lowercased text of a subtree whose class/id hints at a section
+
+        Returns None when the page has no recognizable section, in which case
+        callers fall back to the cached full-page text.
+        """
+        hint = _SECTION_HINTS.get(section)
+        if hint is None:
+            return None
+        node = (soup.find(['section', 'div'], class_=hint)
+                or soup.find(['section', 'div'], id=hint))
+        if node is not None:
+            text = node.get_text(" ", strip=True)
+            if len(text) > 100:
+                return text.lower()
+        return None
+
+    @staticmethod
+    def _extract_context_around_keyword(text: str, keyword: str, context_size: int = 50) -> str:
         """Extract text context around a keyword"""
         keyword_pos = text.find(keyword.lower())
         if keyword_pos == -1:
@@ -640,85 +1511,100 @@ Return only valid JSON:"""
         end = min(len(text), keyword_pos + len(keyword) + context_size)
         return text[start:end]
     
+    def _find_amenity_contexts(self, text: str, context_size: int = 80) -> Dict[str, str]:
+        """Map each amenity category to the context around its first keyword hit
+
+        With pyahocorasick installed this is a single linear pass over the page
+        text; otherwise it falls back to the per-keyword substring scan.
+        """
+        contexts = {}
+        if self._amenity_ac is not None:
+            for end, (category, keyword) in self._amenity_ac.iter(text):
+                if category not in contexts:
+                    start = max(0, end + 1 - len(keyword) - context_size)
+                    contexts[category] = text[start:end + 1 + context_size]
+        else:
+            for category, keywords in AMENITY_CATEGORIES.items():
+                for keyword in keywords:
+                    if keyword in text:
+                        contexts[category] = self._extract_context_around_keyword(
+                            text, keyword, context_size)
+                        break
+        return contexts
+
     async def _extract_amenities_ai(self, soup: BeautifulSoup, hotel_info: IntelligentHotelInfo):
         """AI-enhanced amenities extraction with categorization"""
-        text = soup.get_text().lower()
-        
-        # Define amenity categories with keywords
-        amenity_categories = {
-            'wifi': ['wifi', 'wi-fi', 'internet', 'wireless'],
-            'fitness': ['fitness', 'gym', 'exercise', 'workout'],
-            'pool': ['pool', 'swimming', 'aquatic'],
-            'spa': ['spa', 'massage', 'wellness', 'treatment'],
-            'business': ['business center', 'meeting room', 'conference'],
-            'pets': ['pet', 'dog', 'cat', 'animal'],
-            'accessibility': ['accessible', 'wheelchair', 'ada', 'disability']
-        }
-        
-        # Enhanced amenity extraction
-        for category, keywords in amenity_categories.items():
-            for keyword in keywords:
-                if keyword in text:
-                    context = self._extract_context_around_keyword(text, keyword, 80)
-                    
-                    if category == 'wifi':
-                        if any(term in context for term in ['free', 'complimentary']):
-                            hotel_info.wifi_info = "Free WiFi available"
-                        else:
-                            hotel_info.wifi_info = "WiFi available"
-                    
-                    elif category == 'fitness':
-                        hours_match = re.search(r'(\d{1,2}:?\d{0,2}\s*[ap]m.*?\d{1,2}:?\d{0,2}\s*[ap]m)', context)
-                        hotel_info.fitness_center = {
-                            'available': True,
-                            'hours': hours_match.group(1) if hours_match else 'Check with hotel',
-                            'details': context[:100]
-                        }
-                    
-                    elif category == 'pool':
-                        pool_types = ['indoor', 'outdoor', 'heated', 'seasonal']
-                        pool_type = next((ptype for ptype in pool_types if ptype in context), 'Standard')
-                        hotel_info.pool = {
-                            'available': True,
-                            'type': pool_type,
-                            'details': context[:100]
-                        }
-                    
-                    elif category == 'spa':
-                        if not hotel_info.spa_services:
-                            hotel_info.spa_services = []
-                        spa_services = ['massage', 'facial', 'manicure', 'pedicure', 'sauna']
-                        found_services = [service for service in spa_services if service in context]
-                        hotel_info.spa_services.extend(found_services)
-                    
-                    elif category == 'pets':
-                        if 'friendly' in context or 'welcome' in context:
-                            hotel_info.pet_policy = {'allowed': True, 'details': context[:100]}
-                        elif 'not allowed' in context or 'no pets' in context:
-                            hotel_info.pet_policy = {'allowed': False, 'details': context[:100]}
-                    
-                    break
+        # Fused OpenAI result covers accessibility; keyword scan fills the rest
+        fused = self._openai_prefetch.get("amenities") or {}
+        if fused.get('accessibility_features') and not hotel_info.accessibility_features:
+            hotel_info.accessibility_features = fused['accessibility_features']
+
+        text = self._section_text(soup, 'amenities') or self._page_text_lower or soup.get_text().lower()
+
+        # Enhanced amenity extraction, one category at a time
+        for category, context in self._find_amenity_contexts(text).items():
+            if category == 'wifi':
+                if any(term in context for term in ['free', 'complimentary']):
+                    hotel_info.wifi_info = "Free WiFi available"
+                else:
+                    hotel_info.wifi_info = "WiFi available"
+
+            elif category == 'fitness':
+                hours_match = _HOURS_RE.search(context)
+                hotel_info.fitness_center = {
+                    'available': True,
+                    'hours': hours_match.group(1) if hours_match else 'Check with hotel',
+                    'details': context[:100]
+                }
+
+            elif category == 'pool':
+                pool_types = ['indoor', 'outdoor', 'heated', 'seasonal']
+                pool_type = next((ptype for ptype in pool_types if ptype in context), 'Standard')
+                hotel_info.pool = {
+                    'available': True,
+                    'type': pool_type,
+                    'details': context[:100]
+                }
+
+            elif category == 'spa':
+                if not hotel_info.spa_services:
+                    hotel_info.spa_services = []
+                spa_services = ['massage', 'facial', 'manicure', 'pedicure', 'sauna']
+                found_services = [service for service in spa_services if service in context]
+                hotel_info.spa_services.extend(found_services)
+
+            elif category == 'pets':
+                if 'friendly' in context or 'welcome' in context:
+                    hotel_info.pet_policy = {'allowed': True, 'details': context[:100]}
+                elif 'not allowed' in context or 'no pets' in context:
+                    hotel_info.pet_policy = {'allowed': False, 'details': context[:100]}
     
     async def _extract_dining_info_ai(self, soup: BeautifulSoup, hotel_info: IntelligentHotelInfo):
         """AI-enhanced dining information extraction"""
-        # Look for structured restaurant data
-        restaurant_elements = soup.find_all(['div', 'section'], class_=re.compile(r'restaurant|dining|food'))
-        
+        # Fused OpenAI result supplies restaurant names when available
+        fused = self._openai_prefetch.get("dining") or {}
+        fused_restaurants = [
+            {'name': name, 'cuisine': 'International', 'hours': 'Check with hotel'}
+            for name in (fused.get('restaurants') or [])
+        ]
+
+        # Look for structured restaurant data; the shared section walk
+        # already extracted each element's text once
         restaurants = []
-        for element in restaurant_elements[:5]:  # Limit results
-            restaurant_text = element.get_text(strip=True)
-            
+        for element, restaurant_text in self._classified_sections(soup)['dining']:
             if len(restaurant_text) > 20:  # Filter out noise
                 # Extract restaurant name
                 name_element = element.find(['h1', 'h2', 'h3', 'h4'])
                 name = name_element.get_text(strip=True) if name_element else "Restaurant"
                 
-                # Extract cuisine type using AI
+                # Extract cuisine type using AI; lower the text once for
+                # both the cuisine scan and the hours search
+                rt_lower = restaurant_text.lower()
                 cuisine_keywords = ['italian', 'asian', 'american', 'french', 'mexican', 'seafood', 'steakhouse']
-                cuisine = next((cuisine for cuisine in cuisine_keywords if cuisine in restaurant_text.lower()), 'International')
-                
+                cuisine = next((cuisine for cuisine in cuisine_keywords if cuisine in rt_lower), 'International')
+
                 # Extract hours
-                hours_match = re.search(r'(\d{1,2}:?\d{0,2}\s*[ap]m.*?\d{1,2}:?\d{0,2}\s*[ap]m)', restaurant_text.lower())
+                hours_match = _HOURS_RE.search(rt_lower)
                 hours = hours_match.group(1) if hours_match else 'Check with hotel'
                 
                 restaurants.append({
@@ -727,14 +1613,16 @@ Return only valid JSON:"""
                     'hours': hours,
                     'details': restaurant_text[:200]
                 })
-        
-        hotel_info.restaurants = restaurants
-        
+
+        hotel_info.restaurants = restaurants or fused_restaurants
+
         # Room service extraction
-        text = soup.get_text().lower()
-        if 'room service' in text:
-            room_service_context = self._extract_context_around_keyword(text, 'room service', 100)
-            hours_match = re.search(r'(\d{1,2}:?\d{0,2}\s*[ap]m.*?\d{1,2}:?\d{0,2}\s*[ap]m)', room_service_context)
+        text = self._page_text_lower or soup.get_text().lower()
+        rs_hits = self._scan_page_keywords(text).get('room_service')
+        if rs_hits:
+            room_service_context = self._context_at(
+                text, rs_hits['room service'], len('room service'), 100)
+            hours_match = _HOURS_RE.search(room_service_context)
             
             hotel_info.room_service = {
                 'available': True,
@@ -743,10 +1631,11 @@ Return only valid JSON:"""
             }
         
         # Breakfast information
-        breakfast_keywords = ['breakfast', 'morning meal', 'continental breakfast']
-        for keyword in breakfast_keywords:
-            if keyword in text:
-                breakfast_context = self._extract_context_around_keyword(text, keyword, 100)
+        breakfast_hits = self._scan_page_keywords(text).get('breakfast', {})
+        for keyword in BREAKFAST_KEYWORDS:
+            if keyword in breakfast_hits:
+                breakfast_context = self._context_at(
+                    text, breakfast_hits[keyword], len(keyword), 100)
                 breakfast_type = 'Continental'
                 
                 if 'complimentary' in breakfast_context or 'free' in breakfast_context:
@@ -767,78 +1656,84 @@ Return only valid JSON:"""
     
     async def _extract_nearby_info_ai(self, soup: BeautifulSoup, hotel_info: IntelligentHotelInfo):
         """AI-enhanced nearby attractions extraction with categorization"""
-        text = soup.get_text()
+        text = self._page_text or soup.get_text()
         
         if self.use_ai and self.nlp:
-            # Use spaCy for location and organization extraction
-            doc = self.nlp(text[:3000])  # Limit for performance
-            
+            # Entity-sparse pages (marketing boilerplate) aren't worth a full
+            # NER pass; the regex hits are all they have to offer
+            venue_hits = _VENUE_RE.findall(text[:3000])
+            if len(venue_hits) < 3:
+                attractions = []
+                restaurants = []
+                shopping = []
+                for name, venue in venue_hits:
+                    venue = venue.lower()
+                    if venue in ('museum', 'park', 'theater', 'gallery'):
+                        attractions.append({'name': name, 'type': 'Attraction', 'distance': 'Unknown'})
+                    elif venue in ('restaurant', 'cafe', 'bar', 'bistro'):
+                        restaurants.append({'name': name, 'type': 'Restaurant', 'distance': 'Unknown'})
+                    else:
+                        shopping.append({'name': name, 'type': 'Shopping', 'distance': 'Unknown'})
+                hotel_info.nearby_attractions = attractions[:10]
+                hotel_info.nearby_restaurants = restaurants[:10]
+                hotel_info.nearby_shopping = shopping[:10]
+                return
+
+            # Use spaCy for location and organization extraction. The model
+            # is loaded with everything but NER disabled; running it in a
+            # worker thread keeps the NER pass off the event loop, and the
+            # pipeline lock serializes concurrent scrapes on the shared model.
+            doc = await asyncio.to_thread(self._nlp_call, text[:3000])  # Limit for performance
+
             attractions = []
             restaurants = []
             shopping = []
-            
+            buckets = {'Attraction': attractions, 'Restaurant': restaurants,
+                       'Shopping': shopping}
+
             for ent in doc.ents:
                 if ent.label_ in ["ORG", "GPE", "FAC"]:
-                    entity_text = ent.text.lower()
-                    
-                    # Categorize based on keywords
-                    if any(keyword in entity_text for keyword in ['museum', 'park', 'theater', 'gallery', 'center']):
-                        attractions.append({
-                            'name': ent.text,
-                            'type': 'Attraction',
-                            'distance': 'Unknown'
-                        })
-                    elif any(keyword in entity_text for keyword in ['restaurant', 'cafe', 'bar', 'bistro']):
-                        restaurants.append({
-                            'name': ent.text,
-                            'type': 'Restaurant',
-                            'distance': 'Unknown'
-                        })
-                    elif any(keyword in entity_text for keyword in ['mall', 'shop', 'market', 'store']):
-                        shopping.append({
-                            'name': ent.text,
-                            'type': 'Shopping',
-                            'distance': 'Unknown'
-                        })
-            
+                    # Categorize by token lookup; the trailing-s retry keeps
+                    # simple plurals ("Shops", "Markets") matching
+                    for token in ent.text.lower().split():
+                        category = _NEARBY_KW.get(token) or _NEARBY_KW.get(token.rstrip('s'))
+                        if category:
+                            buckets[category].append({
+                                'name': ent.text,
+                                'type': category,
+                                'distance': 'Unknown'
+                            })
+                            break
+
             hotel_info.nearby_attractions = attractions[:10]
             hotel_info.nearby_restaurants = restaurants[:10]
             hotel_info.nearby_shopping = shopping[:10]
     
     async def _extract_services_ai(self, soup: BeautifulSoup, hotel_info: IntelligentHotelInfo):
         """AI-enhanced services extraction"""
-        text = soup.get_text().lower()
-        
-        service_categories = {
-            'concierge': ['concierge', 'guest services', 'front desk'],
-            'laundry': ['laundry', 'dry cleaning', 'valet service'],
-            'luggage': ['luggage storage', 'baggage', 'bell hop'],
-            'transportation': ['shuttle', 'car service', 'taxi', 'uber'],
-            'meeting': ['meeting room', 'conference', 'event space'],
-            'wellness': ['spa', 'massage', 'wellness center']
-        }
+        text = self._page_text_lower or soup.get_text().lower()
         
+        hits = self._scan_page_keywords(text)
         services = []
-        for category, keywords in service_categories.items():
-            for keyword in keywords:
-                if keyword in text:
-                    context = self._extract_context_around_keyword(text, keyword, 60)
-                    services.append(f"{keyword.title()} - {context[:50]}...")
-                    break
-        
+        for category, keywords in SERVICE_CATEGORIES.items():
+            present = hits.get(f'service:{category}')
+            if not present:
+                continue
+            keyword = next(kw for kw in keywords if kw in present)
+            context = self._context_at(text, present[keyword], len(keyword), 60)
+            services.append(f"{keyword.title()} - {context[:50]}...")
+
         hotel_info.concierge_services = services
     
     async def _extract_room_info_ai(self, soup: BeautifulSoup, hotel_info: IntelligentHotelInfo):
         """AI-enhanced room information extraction"""
-        # Look for room-related sections
-        room_elements = soup.find_all(['div', 'section'], class_=re.compile(r'room|suite|accommodation'))
-        
+        # Look for room-related sections via the shared section walk
         room_types = []
-        amenities = []
-        
-        for element in room_elements[:5]:
-            room_text = element.get_text(strip=True).lower()
-            
+        amenities = set()  # Set membership keeps dedup O(1) per keyword
+
+        for element, section_text in self._classified_sections(soup)['room']:
+            room_text = section_text.lower()
+
             # Extract room types
             room_type_keywords = ['standard', 'deluxe', 'suite', 'premium', 'executive', 'junior suite']
             for room_type in room_type_keywords:
@@ -852,12 +1747,61 @@ Return only valid JSON:"""
             # Extract amenities
             amenity_keywords = ['air conditioning', 'minibar', 'coffee maker', 'safe', 'balcony', 'view']
             for amenity in amenity_keywords:
-                if amenity in room_text and amenity not in amenities:
-                    amenities.append(amenity.title())
-        
+                if amenity in room_text:
+                    amenities.add(amenity.title())
+
         hotel_info.room_types = room_types
-        hotel_info.room_amenities = amenities
+        hotel_info.room_amenities = sorted(amenities)
     
+    async def _generate_llm(self, prompt: str):
+        """Generate text through the shared batching worker
+
+        Concurrent scrapes funnel their prompts into one queue; the worker
+        drains whatever has accumulated and runs a single batched pipeline
+        call, so the model decodes several hotels per forward pass instead
+        of one.
+        """
+        if self._llm_queue is None:
+            self._llm_queue = asyncio.Queue()
+            self._llm_task = asyncio.ensure_future(self._llm_worker())
+        future = asyncio.get_event_loop().create_future()
+        await self._llm_queue.put((prompt, future))
+        return await future
+
+    async def _llm_worker(self, max_batch: int = 8):
+        """Drain queued prompts and run them as one batched generator call"""
+        tokenizer = getattr(self.text_generator, 'tokenizer', None)
+        if tokenizer is not None:
+            # Batched decode needs a pad token and left padding so every
+            # sequence ends at the generation boundary
+            if tokenizer.pad_token_id is None:
+                tokenizer.pad_token = tokenizer.eos_token
+            tokenizer.padding_side = 'left'
+        while True:
+            batch = [await self._llm_queue.get()]
+            while len(batch) < max_batch:
+                try:
+                    batch.append(self._llm_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            prompts = [prompt for prompt, _ in batch]
+            try:
+                # Greedy decode with a tight new-token budget: the KEY: value
+                # format never needs more, and every skipped token is decode
+                # time saved
+                responses = await asyncio.to_thread(
+                    self.text_generator, prompts,
+                    max_new_tokens=256, num_return_sequences=1,
+                    do_sample=False, batch_size=len(prompts)
+                )
+                for (_, future), response in zip(batch, responses):
+                    if not future.done():
+                        future.set_result(response)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
     async def _generate_ai_insights(self, soup: BeautifulSoup, hotel_info: IntelligentHotelInfo):
         """Generate AI-powered insights using GPT-oss-20b"""
         if not self.use_ai or not self.text_generator:
@@ -887,9 +1831,10 @@ NEARBY: [nearby attractions]
 POLICIES: [important policies]
 """
 
-            # Generate response using GPT-oss-20b
+            # Generate response using GPT-oss-20b through the batching
+            # worker, which runs the blocking pipeline call off the loop
             logger.info("Generating AI insights with GPT-oss-20b...")
-            response = self.text_generator(prompt, max_length=len(prompt) + 500, num_return_sequences=1)
+            response = await self._generate_llm(prompt)
             
             if response and len(response) > 0:
                 generated_text = response[0]['generated_text']
@@ -907,162 +1852,137 @@ POLICIES: [important policies]
             self._basic_content_extraction(soup, hotel_info)
     
     def _extract_meaningful_content(self, soup: BeautifulSoup) -> str:
-        """Extract meaningful content, avoiding navigation menus and headers"""
+        """Extract meaningful content, avoiding navigation menus and headers
+
+        Cached per page: the fused OpenAI prefetch and the insight
+        generator both want this text, and the boilerplate decompose walk
+        is only worth paying once.
+        """
+        if self._meaningful_text is not None:
+            return self._meaningful_text
+
         # Remove navigation, headers, footers, and script elements
         for element in soup(['nav', 'header', 'footer', 'script', 'style', 'aside']):
             element.decompose()
-        
+
         # Focus on main content areas
         main_content = soup.find('main') or soup.find('div', class_=['content', 'main']) or soup
         
-        # Get text from paragraphs, divs with meaningful content
-        content_elements = main_content.find_all(['p', 'div', 'section', 'article'], string=True)
-        
+        # Stream strings in document order; one subtree walk replaces the
+        # find_all sweep plus a get_text re-walk per element, and the loop
+        # stops as soon as the quota is filled
         meaningful_text = []
-        for element in content_elements:
-            text = element.get_text(strip=True)
+        for text in main_content.stripped_strings:
+            if len(text) <= 20:
+                continue
+            text_lower = text.lower()
             # Filter out menu items and navigation text
-            if len(text) > 20 and not any(nav_word in text.lower() for nav_word in 
-                                        ['overview', 'menu', 'click here', 'read more', 'view all']):
-                meaningful_text.append(text)
-        
-        return ' '.join(meaningful_text[:10])  # Limit to first 10 meaningful sentences
+            if any(nav_word in text_lower for nav_word in _NAV_WORDS):
+                continue
+            meaningful_text.append(text)
+            if len(meaningful_text) == 10:  # Limit to first 10 meaningful sentences
+                break
+
+        self._meaningful_text = ' '.join(meaningful_text)
+        return self._meaningful_text
     
     def _parse_ai_response(self, ai_response: str, hotel_info: IntelligentHotelInfo):
         """Parse GPT-oss-20b structured response"""
-        lines = ai_response.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            if ':' in line:
-                key, value = line.split(':', 1)
-                key = key.strip()
-                value = value.strip()
-                
-                if key == 'HOTEL_NAME' and value != '[hotel name]':
-                    hotel_info.hotel_name = value
-                elif key == 'ADDRESS' and value != '[full address]':
-                    hotel_info.address = value
-                elif key == 'PHONE' and value != '[phone number]':
-                    hotel_info.phone = value
-                elif key == 'EMAIL' and value != '[email address]':
-                    hotel_info.email = value
-                elif key == 'CHECK_IN' and value != '[check-in time]':
-                    hotel_info.checkin_time = value
-                elif key == 'CHECK_OUT' and value != '[check-out time]':
-                    hotel_info.checkout_time = value
-                elif key == 'AMENITIES' and value != '[list amenities separated by commas]':
-                    hotel_info.room_amenities = [a.strip() for a in value.split(',')]
-                elif key == 'DINING' and value != '[restaurant/dining options]':
-                    hotel_info.restaurants = [value]
-                elif key == 'SPA_SERVICES' and value != '[spa services available]':
-                    hotel_info.spa_services = [a.strip() for a in value.split(',')]
-                elif key == 'NEARBY' and value != '[nearby attractions]':
-                    hotel_info.nearby_attractions = [a.strip() for a in value.split(',')]
-                elif key == 'POLICIES' and value != '[important policies]':
-                    if not hotel_info.cancellation_policy:
-                        hotel_info.cancellation_policy = value
+        for match in _AI_LINE_RE.finditer(ai_response):
+            value = match.group(2)
+            if value.startswith('['):  # Echoed prompt placeholder, not an answer
+                continue
+            _AI_SETTERS[match.group(1)](hotel_info, value)
     
     def _basic_content_extraction(self, soup: BeautifulSoup, hotel_info: IntelligentHotelInfo):
         """Fallback basic extraction if AI fails"""
         logger.info("Using basic content extraction as fallback")
         
         # Extract contact information using simple patterns
-        text = soup.get_text()
+        text = self._page_text or soup.get_text()
         
-        # Phone number pattern
-        import re
-        phone_pattern = r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b'
-        phone_match = re.search(phone_pattern, text)
-        if phone_match and not hotel_info.phone:
-            hotel_info.phone = phone_match.group()
-        
-        # Email pattern
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        email_match = re.search(email_pattern, text)
-        if email_match and not hotel_info.email:
-            hotel_info.email = email_match.group()
+        # Phone and email from the shared single-pass contact scan
+        hits = self._scan_contacts(text)
+        if 'phone' in hits and not hotel_info.phone:
+            hotel_info.phone = hits['phone']
+        if 'email' in hits and not hotel_info.email:
+            hotel_info.email = hits['email']
         
         # Basic amenities extraction
-        amenity_keywords = ['pool', 'wifi', 'parking', 'gym', 'spa', 'restaurant', 'bar', 'fitness']
-        found_amenities = []
-        text_lower = text.lower()
-        for amenity in amenity_keywords:
-            if amenity in text_lower:
-                found_amenities.append(amenity.title())
+        text_lower = self._page_text_lower or text.lower()
+        basic_hits = self._scan_page_keywords(text_lower).get('basic_amenity', ())
+        found_amenities = [amenity.title() for amenity in BASIC_AMENITY_KEYWORDS
+                           if amenity in basic_hits]
         
         if found_amenities and not hotel_info.room_amenities:
             hotel_info.room_amenities = found_amenities
     
     def _calculate_confidence_score(self, hotel_info: IntelligentHotelInfo) -> float:
         """Calculate confidence score based on data completeness"""
-        # Define weights for different data categories
-        field_weights = {
-            'hotel_name': 0.1,
-            'phone': 0.08,
-            'address': 0.08,
-            'checkin_time': 0.07,
-            'checkout_time': 0.07,
-            'parking_available': 0.05,
-            'wifi_info': 0.05,
-            'restaurants': 0.1,
-            'nearby_attractions': 0.08,
-            'room_types': 0.08,
-            'amenities_count': 0.1,
-            'policies_count': 0.08,
-            'services_count': 0.06
-        }
-        
-        score = 0.0
-        
-        # Basic fields
-        if hotel_info.hotel_name and hotel_info.hotel_name != "Unknown Hotel":
-            score += field_weights['hotel_name']
-        if hotel_info.phone:
-            score += field_weights['phone']
-        if hotel_info.address:
-            score += field_weights['address']
-        if hotel_info.checkin_time:
-            score += field_weights['checkin_time']
-        if hotel_info.checkout_time:
-            score += field_weights['checkout_time']
-        if hotel_info.parking_available is not None:
-            score += field_weights['parking_available']
-        if hotel_info.wifi_info:
-            score += field_weights['wifi_info']
-        
-        # Complex fields
-        if hotel_info.restaurants:
-            score += field_weights['restaurants'] * min(len(hotel_info.restaurants) / 3, 1.0)
-        if hotel_info.nearby_attractions:
-            score += field_weights['nearby_attractions'] * min(len(hotel_info.nearby_attractions) / 5, 1.0)
-        if hotel_info.room_types:
-            score += field_weights['room_types'] * min(len(hotel_info.room_types) / 3, 1.0)
-        
-        # Count-based scores
-        amenities_count = sum([
-            bool(hotel_info.fitness_center),
-            bool(hotel_info.pool),
-            bool(hotel_info.spa_services),
-            bool(hotel_info.business_center),
-            bool(hotel_info.pet_policy)
-        ])
-        score += field_weights['amenities_count'] * min(amenities_count / 5, 1.0)
-        
-        policies_count = sum([
-            bool(hotel_info.cancellation_policy),
-            bool(hotel_info.deposit_policy),
-            bool(hotel_info.age_restrictions)
-        ])
-        score += field_weights['policies_count'] * min(policies_count / 3, 1.0)
-        
+        # Per-field completeness ratios in _CONF_WEIGHTS order. Presence
+        # flags are packed into one int and popcounted, skipping the
+        # temporary bool lists
+        amenity_flags = (bool(hotel_info.fitness_center)
+                         | bool(hotel_info.pool) << 1
+                         | bool(hotel_info.spa_services) << 2
+                         | bool(hotel_info.business_center) << 3
+                         | bool(hotel_info.pet_policy) << 4)
+        amenities_count = amenity_flags.bit_count()
+        policy_flags = (bool(hotel_info.cancellation_policy)
+                        | bool(hotel_info.deposit_policy) << 1
+                        | bool(hotel_info.age_restrictions) << 2)
+        policies_count = policy_flags.bit_count()
         services_count = len(hotel_info.concierge_services) if hotel_info.concierge_services else 0
-        score += field_weights['services_count'] * min(services_count / 5, 1.0)
-        
-        return min(score, 1.0)  # Cap at 1.0
+
+        values = np.array([
+            1.0 if hotel_info.hotel_name and hotel_info.hotel_name != "Unknown Hotel" else 0.0,
+            1.0 if hotel_info.phone else 0.0,
+            1.0 if hotel_info.address else 0.0,
+            1.0 if hotel_info.checkin_time else 0.0,
+            1.0 if hotel_info.checkout_time else 0.0,
+            1.0 if hotel_info.parking_available is not None else 0.0,
+            1.0 if hotel_info.wifi_info else 0.0,
+            min(len(hotel_info.restaurants) / 3, 1.0) if hotel_info.restaurants else 0.0,
+            min(len(hotel_info.nearby_attractions) / 5, 1.0) if hotel_info.nearby_attractions else 0.0,
+            min(len(hotel_info.room_types) / 3, 1.0) if hotel_info.room_types else 0.0,
+            min(amenities_count / 5, 1.0),
+            min(policies_count / 3, 1.0),
+            min(services_count / 5, 1.0),
+        ], dtype=np.float32)
+
+        return float(_conf_score(values))
     
+    async def aclose(self):
+        """Close the shared HTTP clients and the WebDriver"""
+        if self._llm_task is not None:
+            self._llm_task.cancel()
+            self._llm_task = None
+        if self._session and not self._session.closed:
+            await self._session.close()
+        if self._openai is not None:
+            await self._openai.close()
+            self._openai = None
+        if self.driver:
+            self.driver.quit()
+            self.driver = None
+
     def close(self):
-        """Close the WebDriver"""
+        """Close the WebDriver and, best-effort, the HTTP session"""
+        if self._sync_loop is not None:
+            # Resources created through the sync API live on the private
+            # loop; tear them down there before retiring it
+            if not self._sync_loop.is_closed():
+                self._sync_loop.run_until_complete(self.aclose())
+                self._sync_loop.close()
+            self._sync_loop = None
+            return
+        if self._session and not self._session.closed:
+            try:
+                loop = asyncio.get_event_loop()
+                if not loop.is_running():
+                    loop.run_until_complete(self._session.close())
+            except RuntimeError:
+                asyncio.run(self._session.close())
         if self.driver:
             self.driver.quit()
 
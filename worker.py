@@ -8,13 +8,99 @@ using Celery for task queue management.
 import os
 import logging
 import asyncio
+import time
+from collections import Counter
+from urllib.parse import urlparse
 from celery import Celery
+from celery.signals import worker_process_init, worker_shutdown
 from intelligent_scraper import IntelligentHotelScraper
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# One event loop per worker process: loop setup/teardown per task is pure
+# overhead, and a persistent loop lets connection pools survive between tasks
+_LOOP = None
+
+def _get_loop():
+    global _LOOP
+    if _LOOP is None:
+        _LOOP = asyncio.new_event_loop()
+        asyncio.set_event_loop(_LOOP)
+    return _LOOP
+
+@worker_process_init.connect
+def _init_worker_loop(**kwargs):
+    """Give each forked worker its own fresh event loop"""
+    global _LOOP, _IDLE_SCRAPERS
+    _LOOP = asyncio.new_event_loop()
+    asyncio.set_event_loop(_LOOP)
+    # The idle queue binds to the loop it first waits on; start clean so a
+    # forked child never inherits a queue tied to the parent's loop
+    _IDLE_SCRAPERS = None
+    del _SCRAPERS[:]
+
+# Process-wide scraper: Selenium startup and AI model attachment cost
+# seconds, so each worker builds one scraper lazily and reuses it for
+# every task instead of paying that per URL
+_SCRAPER = None
+
+def _get_scraper() -> IntelligentHotelScraper:
+    global _SCRAPER
+    if _SCRAPER is None:
+        _SCRAPER = IntelligentHotelScraper(headless=True, use_ai=True)
+    return _SCRAPER
+
+# A scraper instance keeps per-page state (cached page text, keyword hits,
+# OpenAI prefetch) on itself, so one instance must never run two scrapes at
+# once. Batch tasks check a scraper out per in-flight URL instead: up to
+# SCRAPER_CONCURRENCY instances, built lazily, kept warm across batches.
+# The heavyweight AI models are process-wide singletons, so extra instances
+# only add a browser session each.
+_SCRAPERS = []
+_IDLE_SCRAPERS = None
+
+def _scraper_pool() -> asyncio.Queue:
+    global _IDLE_SCRAPERS
+    if _IDLE_SCRAPERS is None:
+        _IDLE_SCRAPERS = asyncio.Queue()
+    return _IDLE_SCRAPERS
+
+async def _checkout_scraper(limit: int) -> IntelligentHotelScraper:
+    pool = _scraper_pool()
+    if not pool.empty():
+        return pool.get_nowait()
+    if len(_SCRAPERS) < limit:
+        scraper = IntelligentHotelScraper(headless=True, use_ai=True)
+        _SCRAPERS.append(scraper)
+        return scraper
+    return await pool.get()
+
+@worker_shutdown.connect
+def _close_scraper(**kwargs):
+    global _SCRAPER
+    if _SCRAPER is not None:
+        _SCRAPER.close()
+        _SCRAPER = None
+    while _SCRAPERS:
+        _SCRAPERS.pop().close()
+
+def _shallow_asdict(obj) -> dict:
+    """Shallow dict of a flat dataclass
+
+    dataclasses.asdict recursively deepcopies every value; the hotel
+    record only holds strings, lists and plain dicts, so a single
+    getattr sweep produces the same payload without the copy pass.
+    """
+    return {name: getattr(obj, name) for name in obj.__dataclass_fields__}
+
 # Configure Celery
 redis_url = os.getenv('REDIS_URL', 'redis://localhost:6379')
 celery_app = Celery(
@@ -23,11 +109,33 @@ celery_app = Celery(
     backend=redis_url
 )
 
+# Serialize task payloads with orjson when available: the per-hotel result
+# dicts are large and the C encoder is several times faster than stdlib json
+if ORJSON_AVAILABLE:
+    from kombu.serialization import register
+    register('orjson',
+             lambda obj: orjson.dumps(
+                 obj, default=str,
+                 option=orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_SERIALIZE_NUMPY),
+             orjson.loads,
+             content_type='application/x-orjson', content_encoding='utf-8')
+_serializer = 'orjson' if ORJSON_AVAILABLE else 'json'
+
+# Batch results carry every scraped field for every hotel; compressing the
+# payload keeps the Redis backend small. lz4 is near-free to decode, gzip
+# is the fallback kombu always has
+try:
+    import lz4  # noqa: F401
+    _compression = 'lz4'
+except ImportError:
+    _compression = 'gzip'
+
 # Celery configuration
 celery_app.conf.update(
-    task_serializer='json',
-    accept_content=['json'],
-    result_serializer='json',
+    task_serializer=_serializer,
+    accept_content=[_serializer, 'json'],
+    result_serializer=_serializer,
+    result_compression=_compression,
     timezone='UTC',
     enable_utc=True,
     task_routes={
@@ -36,57 +144,66 @@ celery_app.conf.update(
     },
     worker_prefetch_multiplier=1,
     task_acks_late=True,
-    worker_max_tasks_per_child=10,
+    # Recycle on real memory pressure (kB) rather than every N tasks;
+    # respawning reloads the AI models and throws the warm scraper away
+    worker_max_memory_per_child=2_000_000,
 )
 
+@celery_app.task(name='worker.housekeep')
+def housekeep():
+    """Periodic cleanup so long-lived workers stay flat on memory"""
+    import gc
+    gc.collect()
+    try:
+        import torch
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+    except ImportError:
+        pass
+    return {'status': 'ok'}
+
 @celery_app.task(bind=True, name='worker.scrape_single_hotel')
 def scrape_single_hotel(self, url: str, hotel_name: str = None):
     """Celery task for scraping a single hotel"""
-    scraper = None
     try:
         logger.info(f"Starting scrape task for {url}")
-        
+
         # Update task state
         self.update_state(
             state='PROGRESS',
             meta={'progress': 10, 'message': 'Initializing scraper...'}
         )
-        
-        scraper = IntelligentHotelScraper(headless=True, use_ai=True)
-        
+
+        scraper = _get_scraper()
+
         self.update_state(
             state='PROGRESS',
             meta={'progress': 30, 'message': 'Loading website...'}
         )
         
-        # Run the async scraping function
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        try:
-            hotel_data = loop.run_until_complete(
-                scraper.scrape_hotel_intelligent(url, hotel_name)
-            )
-        finally:
-            loop.close()
-        
+        # Run the async scraping function on the persistent worker loop
+        hotel_data = _get_loop().run_until_complete(
+            scraper.scrape_hotel_intelligent(url, hotel_name)
+        )
+
         self.update_state(
             state='PROGRESS',
             meta={'progress': 90, 'message': 'Processing results...'}
         )
         
-        # Convert to dict for JSON serialization
-        from dataclasses import asdict
-        result = asdict(hotel_data)
-        
+        # With orjson driving the serializer the dataclass is encoded
+        # natively and the dict conversion can be skipped entirely
+        payload = hotel_data if ORJSON_AVAILABLE else _shallow_asdict(hotel_data)
+
         logger.info(f"Successfully scraped {url} with confidence {hotel_data.confidence_score:.2f}")
-        
+
         return {
             'status': 'success',
-            'data': result,
+            'data': payload,
             'metadata': {
                 'confidence_score': hotel_data.confidence_score,
-                'scraped_fields': len([k for k, v in result.items() if v is not None])
+                'scraped_fields': sum(1 for f in hotel_data.__dataclass_fields__
+                                      if getattr(hotel_data, f) is not None)
             }
         }
         
@@ -97,70 +214,78 @@ def scrape_single_hotel(self, url: str, hotel_name: str = None):
             'error': str(e),
             'url': url
         }
-    finally:
-        if scraper:
-            scraper.close()
 
 @celery_app.task(bind=True, name='worker.scrape_multiple_hotels')
 def scrape_multiple_hotels(self, hotels_list):
     """Celery task for scraping multiple hotels"""
-    scraper = None
     try:
         logger.info(f"Starting batch scrape for {len(hotels_list)} hotels")
-        
-        scraper = IntelligentHotelScraper(headless=True, use_ai=True)
-        results = []
-        
-        for i, hotel in enumerate(hotels_list):
-            url = hotel['url']
-            name = hotel.get('name', 'Unknown Hotel')
-            
-            # Update progress
-            progress = int((i / len(hotels_list)) * 100)
-            self.update_state(
-                state='PROGRESS',
-                meta={
-                    'progress': progress,
-                    'message': f'Scraping {name} ({i+1}/{len(hotels_list)})'
-                }
-            )
-            
-            try:
-                # Run the async scraping function
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                
+
+        async def _scrape_all():
+            # Overlap the latency-bound fetches; concurrency is bounded by
+            # the scraper pool, one exclusive instance per in-flight URL.
+            # Rate limiting is per host: each domain is paced SCRAPER_DELAY
+            # seconds apart while different hosts run in parallel
+            concurrency = int(os.getenv('SCRAPER_CONCURRENCY', '8'))
+            delay = float(os.getenv('SCRAPER_DELAY', '3'))
+            domain_locks = {}
+            domain_last = {}
+            completed = 0
+
+            async def _scrape_one(hotel):
+                nonlocal completed
+                url = hotel['url']
+                name = hotel.get('name', 'Unknown Hotel')
+
+                scraper = await _checkout_scraper(concurrency)
                 try:
-                    hotel_data = loop.run_until_complete(
-                        scraper.scrape_hotel_intelligent(url, name)
-                    )
+                    host = urlparse(url).netloc
+                    lock = domain_locks.setdefault(host, asyncio.Lock())
+                    async with lock:
+                        wait = delay - (time.monotonic() - domain_last.get(host, float('-inf')))
+                        if wait > 0:
+                            await asyncio.sleep(wait)
+                        domain_last[host] = time.monotonic()
+
+                    try:
+                        hotel_data = await scraper.scrape_hotel_intelligent(url, name)
+
+                        result = {
+                            'url': url,
+                            'status': 'success',
+                            'data': hotel_data if ORJSON_AVAILABLE else _shallow_asdict(hotel_data),
+                            'confidence_score': hotel_data.confidence_score
+                        }
+                        logger.info(f"Successfully scraped {name}")
+
+                    except Exception as e:
+                        logger.error(f"Failed to scrape {name}: {str(e)}")
+                        result = {
+                            'url': url,
+                            'status': 'error',
+                            'error': str(e)
+                        }
                 finally:
-                    loop.close()
-                
-                from dataclasses import asdict
-                results.append({
-                    'url': url,
-                    'status': 'success',
-                    'data': asdict(hotel_data),
-                    'confidence_score': hotel_data.confidence_score
-                })
-                
-                logger.info(f"Successfully scraped {name}")
-                
-            except Exception as e:
-                logger.error(f"Failed to scrape {name}: {str(e)}")
-                results.append({
-                    'url': url,
-                    'status': 'error',
-                    'error': str(e)
-                })
-            
-            # Rate limiting between requests
-            if i < len(hotels_list) - 1:
-                asyncio.sleep(3)
-        
-        successful = len([r for r in results if r['status'] == 'success'])
-        failed = len([r for r in results if r['status'] == 'error'])
+                    _scraper_pool().put_nowait(scraper)
+
+                completed += 1
+                self.update_state(
+                    state='PROGRESS',
+                    meta={
+                        'progress': int((completed / len(hotels_list)) * 100),
+                        'message': f'Scraped {name} ({completed}/{len(hotels_list)})'
+                    }
+                )
+                return result
+
+            return await asyncio.gather(*(_scrape_one(h) for h in hotels_list))
+
+        results = _get_loop().run_until_complete(_scrape_all())
+
+        # One pass over the results, no throwaway lists
+        status_counts = Counter(r['status'] for r in results)
+        successful = status_counts['success']
+        failed = status_counts['error']
         
         logger.info(f"Batch scraping completed: {successful} successful, {failed} failed")
         
@@ -180,9 +305,6 @@ def scrape_multiple_hotels(self, hotels_list):
             'status': 'error',
             'error': str(e)
         }
-    finally:
-        if scraper:
-            scraper.close()
 
 if __name__ == '__main__':
     # Start the Celery worker